@@ -4,92 +4,124 @@ Basic Fitness AI Orchestration Demo
 Shows the core multi-agent workflow functionality
 """
 
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+
 from langchain_core.messages import HumanMessage, AIMessage
 from langchain_core.tools import tool
-from langgraph.prebuilt import create_react_agent
 
-from langgraph_supervisor import create_supervisor
-from simple_demo import FakeChatModel
+# langgraph and the mock model are imported lazily inside get_compiled_app so
+# importing this module doesn't pull in the whole graph runtime.
+
+
+# Mock model responses, built once at import so repeated demo runs share the
+# same AIMessage instances instead of reallocating them per run.
+_WORKOUT_MSGS: tuple[AIMessage, ...] = (
+    AIMessage(content="I'll create your workout plan."),
+    AIMessage(content="Let me design your exercise routine."),
+    AIMessage(content="Here's your personalized workout."),
+)
+
+_NUTRITION_MSGS: tuple[AIMessage, ...] = (
+    AIMessage(content="I'll design your nutrition plan."),
+    AIMessage(content="Let me calculate your dietary needs."),
+    AIMessage(content="Here's your meal plan."),
+)
+
+_SUPERVISOR_MSGS: tuple[AIMessage, ...] = (
+    AIMessage(content="I'll coordinate your fitness consultation."),
+    AIMessage(content="Let me connect you with our specialists."),
+    AIMessage(content="Your complete fitness plan is ready."),
+)
+
+
+# Tool entry logs are DEBUG with lazy %s formatting: free at the default
+# INFO level, enabled by the demo entry point for interactive runs.
+logger = logging.getLogger(__name__)
 
 
 # Basic fitness tools
 @tool
 def create_workout_plan(goal: str, level: str, days: int) -> str:
     """Create a workout plan."""
-    print(f"💪 Workout Specialist: Creating {goal} plan for {level}, {days} days/week")
+    logger.debug("💪 Workout Specialist: Creating %s plan for %s, %s days/week", goal, level, days)
     return f"WORKOUT PLAN: {goal} program for {level} level, {days} days per week"
 
 @tool
 def create_meal_plan(goal: str, calories: int) -> str:
     """Create a meal plan."""
-    print(f"🥗 Nutritionist: Creating {goal} meal plan with {calories} calories")
+    logger.debug("🥗 Nutritionist: Creating %s meal plan with %s calories", goal, calories)
     return f"MEAL PLAN: {goal} nutrition plan with {calories} daily calories"
 
 
+@lru_cache(maxsize=1)
+def get_compiled_app():
+    """Build and compile the fitness AI workflow, memoized across demo runs.
+
+    The compiled LangGraph app is reused when the demo is re-run from a REPL
+    or driven from tests, skipping repeated agent construction and graph
+    compilation.
+    """
+    from langgraph.prebuilt import create_react_agent
+
+    from langgraph_supervisor import create_supervisor
+    from simple_demo import FakeChatModel
+
+    # Create agents
+    print("📋 Creating fitness agents...")
+
+    workout_specialist = create_react_agent(
+        model=FakeChatModel(responses=_WORKOUT_MSGS),
+        tools=[create_workout_plan],
+        name="workout_specialist",
+        prompt="You are a workout specialist. Create exercise plans."
+    )
+
+    nutritionist = create_react_agent(
+        model=FakeChatModel(responses=_NUTRITION_MSGS),
+        tools=[create_meal_plan],
+        name="nutritionist",
+        prompt="You are a nutritionist. Create meal plans."
+    )
+
+    print("✅ Created workout_specialist and nutritionist")
+
+    # Create supervisor
+    print("🎯 Creating supervisor...")
+    workflow = create_supervisor(
+        agents=[workout_specialist, nutritionist],
+        model=FakeChatModel(responses=_SUPERVISOR_MSGS),
+        prompt="""You coordinate fitness consultations:
+        - workout_specialist: handles exercise plans
+        - nutritionist: handles meal plans
+
+        Delegate tasks to appropriate specialists."""
+    )
+
+    print("✅ Supervisor created")
+
+    # Compile workflow
+    print("⚙️ Compiling workflow...")
+    return workflow.compile()
+
+
 def run_basic_fitness_demo():
     """Run basic fitness AI demo."""
-    
+
     print("🤖 FITNESS AI ORCHESTRATION - BASIC DEMO")
     print("=" * 60)
     print("🏋️ Workout Specialist + 🥗 Nutritionist + 🎯 AI Supervisor")
     print("=" * 60)
-    
+
     try:
-        # Create mock models
-        workout_responses = [
-            AIMessage(content="I'll create your workout plan."),
-            AIMessage(content="Let me design your exercise routine."),
-            AIMessage(content="Here's your personalized workout."),
-        ]
-        
-        nutrition_responses = [
-            AIMessage(content="I'll design your nutrition plan."),
-            AIMessage(content="Let me calculate your dietary needs."),
-            AIMessage(content="Here's your meal plan."),
-        ]
-        
-        supervisor_responses = [
-            AIMessage(content="I'll coordinate your fitness consultation."),
-            AIMessage(content="Let me connect you with our specialists."),
-            AIMessage(content="Your complete fitness plan is ready."),
-        ]
-        
-        # Create agents
-        print("📋 Creating fitness agents...")
-        
-        workout_specialist = create_react_agent(
-            model=FakeChatModel(responses=workout_responses),
-            tools=[create_workout_plan],
-            name="workout_specialist",
-            prompt="You are a workout specialist. Create exercise plans."
-        )
-        
-        nutritionist = create_react_agent(
-            model=FakeChatModel(responses=nutrition_responses),
-            tools=[create_meal_plan],
-            name="nutritionist", 
-            prompt="You are a nutritionist. Create meal plans."
-        )
-        
-        print("✅ Created workout_specialist and nutritionist")
-        
-        # Create supervisor
-        print("🎯 Creating supervisor...")
-        workflow = create_supervisor(
-            agents=[workout_specialist, nutritionist],
-            model=FakeChatModel(responses=supervisor_responses),
-            prompt="""You coordinate fitness consultations:
-            - workout_specialist: handles exercise plans
-            - nutritionist: handles meal plans
-            
-            Delegate tasks to appropriate specialists."""
-        )
-        
-        print("✅ Supervisor created")
-        
-        # Compile workflow
-        print("⚙️ Compiling workflow...")
-        app = workflow.compile()
+        from simple_demo import FakeChatModel
+
+        app = get_compiled_app()
+        # The cached app's mock models remember where the previous run left
+        # off; rewind them so each run replays the scripted responses.
+        FakeChatModel.reset_all()
         print("✅ Fitness AI system ready!")
         
         # Test scenarios
@@ -99,31 +131,39 @@ def run_basic_fitness_demo():
             "Create both a workout and nutrition plan for general fitness."
         ]
         
-        for i, query in enumerate(scenarios, 1):
+        # Batch the independent scenarios through one call instead of a
+        # sequential invoke loop; return_exceptions isolates a failing
+        # scenario instead of discarding the whole batch.
+        inputs = [
+            {"messages": [HumanMessage(content=query)]} for query in scenarios
+        ]
+
+        results = app.batch(
+            inputs, config={"max_concurrency": len(inputs)}, return_exceptions=True
+        )
+
+        for i, (query, result) in enumerate(zip(scenarios, results), 1):
             print(f"\n🧪 SCENARIO {i}")
             print(f"💬 User: {query}")
             print("-" * 50)
-            
-            try:
-                result = app.invoke({
-                    "messages": [HumanMessage(content=query)]
-                })
-                
-                print(f"✅ Scenario {i} completed!")
-                print(f"📊 Total messages: {len(result['messages'])}")
-                
-                # Show key messages
-                for j, msg in enumerate(result["messages"]):
-                    if hasattr(msg, 'content') and msg.content:
-                        msg_type = type(msg).__name__
-                        agent = getattr(msg, 'name', 'User' if j == 0 else 'System')
-                        print(f"  {j+1}. [{agent}]: {msg.content}")
-                
-                print(f"\n🎯 Final Result: {result['messages'][-1].content}")
-                
-            except Exception as e:
-                print(f"❌ Error in scenario {i}: {e}")
-            
+
+            if isinstance(result, Exception):
+                print(f"❌ Error in scenario {i}: {result}")
+                print("\n" + "=" * 60)
+                continue
+
+            print(f"✅ Scenario {i} completed!")
+            print(f"📊 Total messages: {len(result['messages'])}")
+
+            # Show key messages
+            for j, msg in enumerate(result["messages"]):
+                if hasattr(msg, 'content') and msg.content:
+                    msg_type = type(msg).__name__
+                    agent = getattr(msg, 'name', 'User' if j == 0 else 'System')
+                    print(f"  {j+1}. [{agent}]: {msg.content}")
+
+            print(f"\n🎯 Final Result: {result['messages'][-1].content}")
+
             print("\n" + "=" * 60)
         
         print("\n🎉 FITNESS AI ORCHESTRATION DEMO COMPLETED!")
@@ -147,4 +187,5 @@ def run_basic_fitness_demo():
 
 
 if __name__ == "__main__":
-    run_basic_fitness_demo() 
\ No newline at end of file
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    run_basic_fitness_demo()
\ No newline at end of file
@@ -7,8 +7,18 @@ A LangGraph multi-agent system with:
 - Nutritionist Agent: Provides diet plans and nutrition advice
 """
 
+import asyncio
+import atexit
+import logging
+import logging.handlers
 import os
-from typing import List, Dict, Any
+from contextlib import contextmanager
+import queue
+import string
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, NamedTuple
 from langchain_core.messages import HumanMessage, AIMessage
 from langchain_core.tools import tool
 from langgraph.prebuilt import create_react_agent
@@ -16,92 +26,496 @@ from langgraph.prebuilt import create_react_agent
 from langgraph_supervisor import create_supervisor
 
 
+# Tool logging goes through a queue drained on a background thread, so tool
+# calls pay a queue append instead of a blocking stdout write + flush. Tool
+# entry logs are emitted at DEBUG with lazy %s formatting, so at the default
+# INFO level (batch evaluation, CI) they cost a single level check; the
+# interactive demo lowers the level to DEBUG under __main__.
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(sys.stdout)
+)
+_log_listener.start()
+# Flush anything still queued when the process exits; without this, records
+# enqueued near the end of a run are silently dropped.
+atexit.register(_log_listener.stop)
+
+
+# =============================================================================
+# STATIC LOOKUP TABLES
+# Built once at import time so tool calls only do lookups, no dict rebuilding.
+# =============================================================================
+
+# Workout plan templates based on goals
+_WORKOUT_PLANS = MappingProxyType({
+    "weight_loss": {
+        "beginner": "3-day full body circuit training with cardio intervals",
+        "intermediate": "4-day upper/lower split with HIIT sessions",
+        "advanced": "5-day push/pull/legs with daily cardio"
+    },
+    "muscle_gain": {
+        "beginner": "3-day full body strength training",
+        "intermediate": "4-day upper/lower split with progressive overload",
+        "advanced": "6-day push/pull/legs with isolation work"
+    },
+    "strength": {
+        "beginner": "3-day compound movement focus",
+        "intermediate": "4-day powerlifting style training",
+        "advanced": "5-day strength specialization program"
+    },
+    "endurance": {
+        "beginner": "3-day cardio base building",
+        "intermediate": "4-day mixed cardio training",
+        "advanced": "6-day endurance specialization"
+    },
+    "general_fitness": {
+        "beginner": "3-day balanced fitness routine",
+        "intermediate": "4-day functional fitness program",
+        "advanced": "5-day comprehensive fitness plan"
+    }
+})
+
+# Equipment considerations
+_EQUIPMENT_NOTES = MappingProxyType({
+    "none": "Bodyweight exercises only",
+    "basic": "Using dumbbells, resistance bands, and bodyweight",
+    "gym": "Full gym equipment available",
+    "home_gym": "Home gym setup with weights and machines"
+})
+
+# Exercise modifications for injuries and limitations
+_EXERCISE_MODIFICATIONS = MappingProxyType({
+    "squats": {
+        "knee_injury": "Wall sits, chair squats, or partial range squats",
+        "back_pain": "Goblet squats with proper form, box squats",
+        "no_equipment": "Bodyweight squats, jump squats, single-leg squats"
+    },
+    "deadlifts": {
+        "back_pain": "Romanian deadlifts, trap bar deadlifts, or hip hinges",
+        "knee_injury": "Single-leg RDLs, good mornings",
+        "no_equipment": "Single-leg deadlifts, glute bridges"
+    },
+    "push_ups": {
+        "wrist_pain": "Push-ups on fists, incline push-ups",
+        "shoulder_injury": "Wall push-ups, chest press with bands",
+        "too_difficult": "Knee push-ups, incline push-ups"
+    },
+    "running": {
+        "knee_injury": "Swimming, cycling, elliptical training",
+        "back_pain": "Walking, water jogging, recumbent bike",
+        "no_equipment": "Walking, stair climbing, bodyweight cardio"
+    }
+})
+
+# Activity multipliers for TDEE estimates
+_ACTIVITY_MULTIPLIERS = MappingProxyType({
+    "sedentary": 1.2,
+    "light": 1.375,
+    "moderate": 1.55,
+    "active": 1.725,
+    "very_active": 1.9
+})
+
+# Mifflin-St Jeor constant term per gender (female is the fallback)
+_GENDER_OFFSET = MappingProxyType({"male": 5, "female": -161})
+
+# Goals that warrant the higher 2.2 g/kg protein target
+_HIGH_PROTEIN_GOALS = frozenset({"muscle_gain", "weight_loss"})
+
+# Activity levels that get the larger exercise-hydration allowance
+_HIGH_ACTIVITY = frozenset({"active", "very_active"})
+
+# Calorie adjustments per nutrition goal
+_GOAL_ADJUSTMENTS = MappingProxyType({
+    "weight_loss": -500,  # 1 lb per week loss
+    "muscle_gain": +300,  # Lean bulk
+    "maintenance": 0
+})
+
+# Macronutrient ratios based on goals
+_MACRO_RATIOS = MappingProxyType({
+    "weight_loss": {"protein": 30, "carbs": 35, "fat": 35},
+    "muscle_gain": {"protein": 25, "carbs": 45, "fat": 30},
+    "maintenance": {"protein": 20, "carbs": 50, "fat": 30},
+    "performance": {"protein": 20, "carbs": 55, "fat": 25}
+})
+
+# Sample meal suggestions based on restrictions
+_MEAL_SUGGESTIONS = MappingProxyType({
+    "none": {
+        "protein": "Chicken, fish, eggs, Greek yogurt, lean beef",
+        "carbs": "Rice, oats, sweet potato, quinoa, fruits",
+        "fats": "Avocado, nuts, olive oil, salmon"
+    },
+    "vegetarian": {
+        "protein": "Eggs, Greek yogurt, legumes, tofu, cheese",
+        "carbs": "Rice, oats, sweet potato, quinoa, fruits",
+        "fats": "Avocado, nuts, olive oil, seeds"
+    },
+    "vegan": {
+        "protein": "Legumes, tofu, tempeh, seitan, protein powder",
+        "carbs": "Rice, oats, sweet potato, quinoa, fruits",
+        "fats": "Avocado, nuts, olive oil, seeds, tahini"
+    },
+    "gluten_free": {
+        "protein": "Chicken, fish, eggs, Greek yogurt, legumes",
+        "carbs": "Rice, quinoa, sweet potato, fruits, GF oats",
+        "fats": "Avocado, nuts, olive oil, salmon"
+    }
+})
+
+class _MealPlan(NamedTuple):
+    """One row of the flattened (goal, restriction) meal-plan matrix."""
+    protein_pct: int
+    carb_pct: int
+    fat_pct: int
+    protein_src: str
+    carb_src: str
+    fat_src: str
+
+
+# Flat (goal, restriction) -> _MealPlan matrix, cross-product materialized at
+# import time: the meal-plan hot path does one dict hit plus attribute access
+# instead of two table lookups and six subscripts. 16 rows, fits in L1.
+_PLAN = {
+    (goal, restriction): _MealPlan(
+        ratios["protein"], ratios["carbs"], ratios["fat"],
+        sugg["protein"], sugg["carbs"], sugg["fats"],
+    )
+    for goal, ratios in _MACRO_RATIOS.items()
+    for restriction, sugg in _MEAL_SUGGESTIONS.items()
+}
+
+# Pre-workout recommendations
+_PRE_WORKOUT = MappingProxyType({
+    "strength": {
+        "timing": "30-60 minutes before",
+        "foods": "Banana with almond butter, oatmeal with berries, Greek yogurt with honey"
+    },
+    "cardio": {
+        "timing": "30-45 minutes before",
+        "foods": "Toast with jam, banana, small smoothie with fruit"
+    },
+    "hiit": {
+        "timing": "30-45 minutes before",
+        "foods": "Apple with small amount of nut butter, dates, small energy bar"
+    },
+    "endurance": {
+        "timing": "1-2 hours before",
+        "foods": "Oatmeal with banana, whole grain toast with honey, energy bar"
+    }
+})
+
+# Post-workout recommendations
+_POST_WORKOUT = MappingProxyType({
+    "strength": {
+        "timing": "Within 30-60 minutes",
+        "foods": "Protein shake with banana, chicken with rice, Greek yogurt with granola"
+    },
+    "cardio": {
+        "timing": "Within 30-45 minutes",
+        "foods": "Chocolate milk, smoothie with protein, turkey sandwich"
+    },
+    "hiit": {
+        "timing": "Within 30 minutes",
+        "foods": "Protein shake, eggs with toast, recovery smoothie"
+    },
+    "endurance": {
+        "timing": "Within 30 minutes",
+        "foods": "Recovery drink, pasta with protein, quinoa bowl with vegetables"
+    }
+})
+
+# Time-of-day adjustments for workout nutrition
+_TIME_ADJUSTMENTS = MappingProxyType({
+    "morning": "Consider lighter pre-workout options, focus on easily digestible carbs",
+    "afternoon": "Normal pre/post workout nutrition timing applies",
+    "evening": "Lighter post-workout meals, avoid heavy foods close to bedtime"
+})
+
+# Display strings for the closed set of enum-like tool arguments. A dict hit
+# replaces the two string passes (.replace + .title) per formatted field;
+# only unknown values fall back to computing the display form.
+_DISPLAY = MappingProxyType({
+    "weight_loss": "Weight Loss",
+    "muscle_gain": "Muscle Gain",
+    "maintenance": "Maintenance",
+    "performance": "Performance",
+    "strength": "Strength",
+    "endurance": "Endurance",
+    "general_fitness": "General Fitness",
+    "beginner": "Beginner",
+    "intermediate": "Intermediate",
+    "advanced": "Advanced",
+    "none": "None",
+    "vegetarian": "Vegetarian",
+    "vegan": "Vegan",
+    "gluten_free": "Gluten Free",
+    "dairy_free": "Dairy Free",
+    "sedentary": "Sedentary",
+    "light": "Light",
+    "moderate": "Moderate",
+    "active": "Active",
+    "very_active": "Very Active",
+    "knee_injury": "Knee Injury",
+    "back_pain": "Back Pain",
+    "no_equipment": "No Equipment",
+    "wrist_pain": "Wrist Pain",
+    "shoulder_injury": "Shoulder Injury",
+    "too_difficult": "Too Difficult",
+    "cardio": "Cardio",
+    "hiit": "Hiit",
+    "morning": "Morning",
+    "afternoon": "Afternoon",
+    "evening": "Evening",
+    "male": "Male",
+    "female": "Female",
+})
+
+
+def _display(value: str) -> str:
+    """Human-readable form of an enum-like tool argument."""
+    return _DISPLAY.get(value, value.replace('_', ' ').title())
+
+
+# Dietary restriction modifications
+_RESTRICTION_MODS = MappingProxyType({
+    "vegan": "Replace dairy with plant-based alternatives, use plant proteins",
+    "vegetarian": "Include eggs and dairy, focus on complete proteins",
+    "gluten_free": "Use gluten-free grains and certified products",
+    "dairy_free": "Use non-dairy milk alternatives and dairy-free proteins"
+})
+
+# Response templates, precompiled at import time. The bulk of each tool's
+# reply is static boilerplate; substituting only the dynamic fields into a
+# ready-made Template avoids re-materializing the static lines per call.
+_MEAL_PLAN_TEMPLATE = string.Template("""
+🍽️ PERSONALIZED MEAL PLAN:
+
+Goal: $goal
+Restrictions: $restrictions
+Daily Calories: $calories
+Meals per Day: $meals
+
+MACRONUTRIENT BREAKDOWN:
+- Protein: ${protein_grams}g ($protein_pct% of calories)
+- Carbohydrates: ${carb_grams}g ($carb_pct% of calories)
+- Fats: ${fat_grams}g ($fat_pct% of calories)
+
+FOOD RECOMMENDATIONS:
+Protein Sources: $protein_sources
+Carbohydrate Sources: $carb_sources
+Healthy Fats: $fat_sources
+
+MEAL TIMING TIPS:
+- Eat protein with every meal
+- Have carbs around workouts
+- Include vegetables with most meals
+- Stay hydrated (8-10 glasses water/day)
+- Plan and prep meals in advance
+
+Duration: Follow for 2-4 weeks, then reassess and adjust
+""")
+
+_NUTRITION_NEEDS_TEMPLATE = string.Template("""
+🧮 NUTRITIONAL NEEDS CALCULATED:
+
+Personal Info:
+- Gender: $gender
+- Age: $age years
+- Weight: $weight kg
+- Height: $height cm
+- Activity: $activity
+
+Caloric Needs:
+- BMR (Base Metabolic Rate): $bmr calories/day
+- TDEE (Total Daily Energy): $tdee calories/day
+- Target Calories for $goal: $target_calories calories/day
+
+Protein Requirements:
+- Recommended Protein: ${protein_grams}g per day
+- Protein per meal: ${protein_per_meal}g (if 3 meals/day)
+
+Hydration Needs:
+- Daily Water Target: ${total_water}ml ($glasses glasses)
+- Pre-workout: 250ml (1 hour before)
+- During workout: 150-250ml every 15-20 minutes
+- Post-workout: 150% of fluid lost through sweat
+
+Micronutrient Focus:
+- Vitamin D, B12, Iron (especially for active individuals)
+- Omega-3 fatty acids for recovery
+- Antioxidants from colorful fruits and vegetables
+""")
+
+_PRE_POST_WORKOUT_TEMPLATE = string.Template("""
+🏃‍♂️ PRE & POST WORKOUT NUTRITION:
+
+Workout Details:
+- Type: $workout_type
+- Duration: $duration minutes
+- Time: $time_of_day
+- Restrictions: $restrictions
+
+PRE-WORKOUT NUTRITION:
+Timing: $pre_timing
+Recommended Foods: $pre_foods
+Goal: Provide energy, prevent hunger, optimize performance
+
+POST-WORKOUT NUTRITION:
+Timing: $post_timing
+Recommended Foods: $post_foods
+Goal: Muscle recovery, glycogen replenishment, adaptation
+
+TIME-SPECIFIC CONSIDERATIONS:
+$time_note
+
+DIETARY MODIFICATIONS:
+$restriction_note
+
+HYDRATION REMINDERS:
+- Pre-workout: 250ml water 1 hour before
+- During: 150-250ml every 15-20 minutes
+- Post: 150% of fluid lost through sweat
+
+GENERAL TIPS:
+- Avoid high fiber/fat foods immediately pre-workout
+- Include both carbs and protein post-workout
+- Listen to your body and adjust portions as needed
+""")
+
+# Heart-rate zones are a pure function of age, so precompute
+# (max_hr, fat_burn, cardio, peak) for ages 0-120 once at import; the
+# metrics tool then does a single tuple index instead of eight multiplies.
+_HR_ZONES = tuple(
+    (
+        220 - a,
+        (int((220 - a) * 0.6), int((220 - a) * 0.7)),
+        (int((220 - a) * 0.7), int((220 - a) * 0.85)),
+        (int((220 - a) * 0.85), int((220 - a) * 0.95)),
+    )
+    for a in range(0, 121)
+)
+
+
+def _compute_metrics(current_weight, target_weight, height_cm, age, activity_multiplier):
+    """Numeric core of calculate_training_metrics.
+
+    Kept as pure scalar arithmetic (no dicts or string handling) so numba
+    can JIT-compile it to native code when installed; otherwise it runs as
+    plain Python with identical results.
+    """
+    height_m = height_cm / 100
+    current_bmi = current_weight / (height_m ** 2)
+    target_bmi = target_weight / (height_m ** 2)
+    # Basic metabolic rate (Mifflin-St Jeor equation - simplified)
+    bmr = 10 * current_weight + 6.25 * height_cm - 5 * age + 5  # Male formula
+    tdee = bmr * activity_multiplier
+    return current_bmi, target_bmi, bmr, tdee
+
+
+try:
+    from numba import njit
+    _compute_metrics = njit(cache=True, fastmath=True)(_compute_metrics)
+except ImportError:
+    pass
+
+
 # =============================================================================
 # WORKOUT SPECIALIST TOOLS
 # =============================================================================
 
+@lru_cache(maxsize=256)
+def _create_workout_plan_cached(
+    fitness_goal: str,
+    experience_level: str,
+    available_days: int,
+    equipment: str
+) -> str:
+    """Build the workout plan text; memoized since it is pure in its args."""
+    base_plan = _WORKOUT_PLANS.get(fitness_goal, _WORKOUT_PLANS["general_fitness"])
+    plan_description = base_plan.get(experience_level, base_plan["beginner"])
+    
+    # Adjust for available days
+    if available_days < 3:
+        plan_description = f"Modified 2-day version: {plan_description}"
+    elif available_days > 5:
+        plan_description = f"Extended {available_days}-day version: {plan_description}"
+    
+    equipment_note = _EQUIPMENT_NOTES.get(equipment, _EQUIPMENT_NOTES["basic"])
+
+    # str.join pre-sizes the output buffer, so the plan text is built with a
+    # single allocation instead of one per interpolation.
+    return "\n".join((
+        "",
+        "🏋️ WORKOUT PLAN CREATED:",
+        f"Goal: {_display(fitness_goal)}",
+        f"Level: {_display(experience_level)}",
+        f"Schedule: {available_days} days per week",
+        f"Equipment: {equipment_note}",
+        "",
+        f"Plan: {plan_description}",
+        "",
+        "Key Focus Areas:",
+        "- Progressive overload principles",
+        "- Proper form and technique",
+        "- Recovery and rest days",
+        "- Injury prevention strategies",
+        "",
+        "Recommended duration: 8-12 weeks before reassessment",
+        "",
+    ))
+
+
 @tool
 def create_workout_plan(
-    fitness_goal: str, 
-    experience_level: str, 
+    fitness_goal: str,
+    experience_level: str,
     available_days: int,
     equipment: str = "basic"
 ) -> str:
     """Create a personalized workout plan based on user's goals and constraints.
-    
+
     Args:
         fitness_goal: Primary fitness goal (weight_loss, muscle_gain, strength, endurance, general_fitness)
         experience_level: User's experience (beginner, intermediate, advanced)
         available_days: Number of days per week available for workouts (1-7)
         equipment: Available equipment (none, basic, gym, home_gym)
     """
-    print(f"💪 Workout Specialist: Creating {fitness_goal} plan for {experience_level} level")
-    
-    # Workout plan templates based on goals
-    workout_plans = {
-        "weight_loss": {
-            "beginner": "3-day full body circuit training with cardio intervals",
-            "intermediate": "4-day upper/lower split with HIIT sessions",
-            "advanced": "5-day push/pull/legs with daily cardio"
-        },
-        "muscle_gain": {
-            "beginner": "3-day full body strength training",
-            "intermediate": "4-day upper/lower split with progressive overload",
-            "advanced": "6-day push/pull/legs with isolation work"
-        },
-        "strength": {
-            "beginner": "3-day compound movement focus",
-            "intermediate": "4-day powerlifting style training",
-            "advanced": "5-day strength specialization program"
-        },
-        "endurance": {
-            "beginner": "3-day cardio base building",
-            "intermediate": "4-day mixed cardio training",
-            "advanced": "6-day endurance specialization"
-        },
-        "general_fitness": {
-            "beginner": "3-day balanced fitness routine",
-            "intermediate": "4-day functional fitness program",
-            "advanced": "5-day comprehensive fitness plan"
-        }
-    }
-    
-    base_plan = workout_plans.get(fitness_goal, workout_plans["general_fitness"])
-    plan_description = base_plan.get(experience_level, base_plan["beginner"])
-    
-    # Adjust for available days
-    if available_days < 3:
-        plan_description = f"Modified 2-day version: {plan_description}"
-    elif available_days > 5:
-        plan_description = f"Extended {available_days}-day version: {plan_description}"
-    
-    # Equipment considerations
-    equipment_notes = {
-        "none": "Bodyweight exercises only",
-        "basic": "Using dumbbells, resistance bands, and bodyweight",
-        "gym": "Full gym equipment available",
-        "home_gym": "Home gym setup with weights and machines"
-    }
-    
-    equipment_note = equipment_notes.get(equipment, equipment_notes["basic"])
-    
-    return f"""
-🏋️ WORKOUT PLAN CREATED:
-Goal: {fitness_goal.replace('_', ' ').title()}
-Level: {experience_level.title()}
-Schedule: {available_days} days per week
-Equipment: {equipment_note}
-
-Plan: {plan_description}
-
-Key Focus Areas:
-- Progressive overload principles
-- Proper form and technique
-- Recovery and rest days
-- Injury prevention strategies
-
-Recommended duration: 8-12 weeks before reassessment
-"""
+    logger.debug("💪 Workout Specialist: Creating %s plan for %s level", fitness_goal, experience_level)
+    return _create_workout_plan_cached(fitness_goal, experience_level, available_days, equipment)
+
+
+@lru_cache(maxsize=256)
+def _suggest_exercise_modifications_cached(
+    exercise_name: str,
+    limitation: str,
+    fitness_level: str
+) -> str:
+    """Build the exercise modification text; memoized since it is pure in its args."""
+    exercise_mods = _EXERCISE_MODIFICATIONS.get(exercise_name.lower(), {})
+    modification = exercise_mods.get(limitation, f"Consult with a physical therapist for {exercise_name} modifications")
+
+    return "\n".join((
+        "",
+        "🔧 EXERCISE MODIFICATION:",
+        f"Original Exercise: {exercise_name.title()}",
+        f"Limitation: {_display(limitation)}",
+        f"Fitness Level: {_display(fitness_level)}",
+        "",
+        f"Recommended Modification: {modification}",
+        "",
+        "Additional Tips:",
+        "- Start with lower intensity and progress gradually",
+        "- Focus on proper form over speed or weight",
+        "- Listen to your body and stop if pain occurs",
+        "- Consider working with a qualified trainer",
+        "",
+    ))
 
 
 @tool
@@ -111,54 +525,60 @@ def suggest_exercise_modifications(
     fitness_level: str = "intermediate"
 ) -> str:
     """Suggest exercise modifications for injuries, limitations, or equipment constraints.
-    
+
     Args:
         exercise_name: Name of the exercise to modify
         limitation: Type of limitation (knee_injury, back_pain, no_equipment, etc.)
         fitness_level: User's fitness level for appropriate modifications
     """
-    print(f"💪 Workout Specialist: Modifying {exercise_name} for {limitation}")
-    
-    modifications = {
-        "squats": {
-            "knee_injury": "Wall sits, chair squats, or partial range squats",
-            "back_pain": "Goblet squats with proper form, box squats",
-            "no_equipment": "Bodyweight squats, jump squats, single-leg squats"
-        },
-        "deadlifts": {
-            "back_pain": "Romanian deadlifts, trap bar deadlifts, or hip hinges",
-            "knee_injury": "Single-leg RDLs, good mornings",
-            "no_equipment": "Single-leg deadlifts, glute bridges"
-        },
-        "push_ups": {
-            "wrist_pain": "Push-ups on fists, incline push-ups",
-            "shoulder_injury": "Wall push-ups, chest press with bands",
-            "too_difficult": "Knee push-ups, incline push-ups"
-        },
-        "running": {
-            "knee_injury": "Swimming, cycling, elliptical training",
-            "back_pain": "Walking, water jogging, recumbent bike",
-            "no_equipment": "Walking, stair climbing, bodyweight cardio"
-        }
-    }
-    
-    exercise_mods = modifications.get(exercise_name.lower(), {})
-    modification = exercise_mods.get(limitation, f"Consult with a physical therapist for {exercise_name} modifications")
+    logger.debug("💪 Workout Specialist: Modifying %s for %s", exercise_name, limitation)
+    return _suggest_exercise_modifications_cached(exercise_name, limitation, fitness_level)
+
+
+@lru_cache(maxsize=256)
+def _calculate_training_metrics_cached(
+    current_weight: float,
+    target_weight: float,
+    height_cm: float,
+    age: int,
+    activity_level: str
+) -> str:
+    """Build the training metrics text; memoized since it is pure in its args."""
+    # BMI, BMR, and TDEE come from the (optionally JIT-compiled) kernel
+    current_bmi, target_bmi, bmr, tdee = _compute_metrics(
+        current_weight, target_weight, height_cm, age,
+        _ACTIVITY_MULTIPLIERS.get(activity_level, 1.55)
+    )
+
+    # Heart rate zones come from the precomputed per-age table
+    max_hr, fat_burn_zone, cardio_zone, peak_zone = _HR_ZONES[min(max(age, 0), 120)]
     
-    return f"""
-🔧 EXERCISE MODIFICATION:
-Original Exercise: {exercise_name.title()}
-Limitation: {limitation.replace('_', ' ').title()}
-Fitness Level: {fitness_level.title()}
-
-Recommended Modification: {modification}
-
-Additional Tips:
-- Start with lower intensity and progress gradually
-- Focus on proper form over speed or weight
-- Listen to your body and stop if pain occurs
-- Consider working with a qualified trainer
-"""
+    return "\n".join((
+        "",
+        "📊 TRAINING METRICS CALCULATED:",
+        "",
+        "Body Composition:",
+        f"- Current BMI: {current_bmi:.1f}",
+        f"- Target BMI: {target_bmi:.1f}",
+        f"- Weight Goal: {abs(target_weight - current_weight):.1f} kg to {'lose' if target_weight < current_weight else 'gain'}",
+        "",
+        "Heart Rate Zones:",
+        f"- Fat Burn Zone: {fat_burn_zone[0]}-{fat_burn_zone[1]} bpm (60-70% max HR)",
+        f"- Cardio Zone: {cardio_zone[0]}-{cardio_zone[1]} bpm (70-85% max HR)",
+        f"- Peak Zone: {peak_zone[0]}-{peak_zone[1]} bpm (85-95% max HR)",
+        f"- Maximum HR: {max_hr} bpm",
+        "",
+        "Calorie Information:",
+        f"- Estimated BMR: {bmr:.0f} calories/day",
+        f"- Estimated TDEE: {tdee:.0f} calories/day",
+        f"- Activity Level: {_display(activity_level)}",
+        "",
+        "Training Recommendations:",
+        "- Use heart rate zones to optimize workout intensity",
+        "- Track progress with weekly measurements",
+        "- Adjust calorie intake based on goals and activity",
+        "",
+    ))
 
 
 @tool
@@ -170,7 +590,7 @@ def calculate_training_metrics(
     activity_level: str = "moderate"
 ) -> str:
     """Calculate training metrics like BMI, target heart rate zones, and calorie burn estimates.
-    
+
     Args:
         current_weight: Current weight in kg
         target_weight: Target weight in kg
@@ -178,62 +598,57 @@ def calculate_training_metrics(
         age: Age in years
         activity_level: Activity level (sedentary, light, moderate, active, very_active)
     """
-    print(f"💪 Workout Specialist: Calculating training metrics for user")
-    
-    # Calculate BMI
-    height_m = height_cm / 100
-    current_bmi = current_weight / (height_m ** 2)
-    target_bmi = target_weight / (height_m ** 2)
-    
-    # Calculate target heart rate zones
-    max_hr = 220 - age
-    fat_burn_zone = (int(max_hr * 0.6), int(max_hr * 0.7))
-    cardio_zone = (int(max_hr * 0.7), int(max_hr * 0.85))
-    peak_zone = (int(max_hr * 0.85), int(max_hr * 0.95))
-    
-    # Estimate daily calorie burn for exercise
-    activity_multipliers = {
-        "sedentary": 1.2,
-        "light": 1.375,
-        "moderate": 1.55,
-        "active": 1.725,
-        "very_active": 1.9
-    }
-    
-    # Basic metabolic rate (Mifflin-St Jeor equation - simplified)
-    bmr = 10 * current_weight + 6.25 * height_cm - 5 * age + 5  # Male formula
-    tdee = bmr * activity_multipliers.get(activity_level, 1.55)
-    
-    return f"""
-📊 TRAINING METRICS CALCULATED:
-
-Body Composition:
-- Current BMI: {current_bmi:.1f}
-- Target BMI: {target_bmi:.1f}
-- Weight Goal: {abs(target_weight - current_weight):.1f} kg to {'lose' if target_weight < current_weight else 'gain'}
-
-Heart Rate Zones:
-- Fat Burn Zone: {fat_burn_zone[0]}-{fat_burn_zone[1]} bpm (60-70% max HR)
-- Cardio Zone: {cardio_zone[0]}-{cardio_zone[1]} bpm (70-85% max HR)
-- Peak Zone: {peak_zone[0]}-{peak_zone[1]} bpm (85-95% max HR)
-- Maximum HR: {max_hr} bpm
-
-Calorie Information:
-- Estimated BMR: {bmr:.0f} calories/day
-- Estimated TDEE: {tdee:.0f} calories/day
-- Activity Level: {activity_level.replace('_', ' ').title()}
-
-Training Recommendations:
-- Use heart rate zones to optimize workout intensity
-- Track progress with weekly measurements
-- Adjust calorie intake based on goals and activity
-"""
+    logger.debug("💪 Workout Specialist: Calculating training metrics for user")
+    return _calculate_training_metrics_cached(
+        current_weight, target_weight, height_cm, age, activity_level
+    )
 
 
 # =============================================================================
 # NUTRITIONIST TOOLS
 # =============================================================================
 
+@lru_cache(maxsize=256)
+def _create_meal_plan_cached(
+    dietary_goal: str,
+    dietary_restrictions: str,
+    meals_per_day: int,
+    calorie_target: int
+) -> str:
+    """Build the meal plan text; memoized since it is pure in its args."""
+    plan = _PLAN.get((dietary_goal, dietary_restrictions))
+    if plan is None:
+        # Unknown goal or restriction: fall back per-component so a known
+        # goal still gets its own ratios (and vice versa).
+        ratios = _MACRO_RATIOS.get(dietary_goal, _MACRO_RATIOS["maintenance"])
+        sugg = _MEAL_SUGGESTIONS.get(dietary_restrictions, _MEAL_SUGGESTIONS["none"])
+        plan = _MealPlan(
+            ratios["protein"], ratios["carbs"], ratios["fat"],
+            sugg["protein"], sugg["carbs"], sugg["fats"],
+        )
+
+    # Calculate macros in grams
+    protein_grams = calorie_target * (plan.protein_pct / 100) / 4
+    carb_grams = calorie_target * (plan.carb_pct / 100) / 4
+    fat_grams = calorie_target * (plan.fat_pct / 100) / 9
+
+    return _MEAL_PLAN_TEMPLATE.substitute(
+        goal=_display(dietary_goal),
+        restrictions=_display(dietary_restrictions),
+        calories=calorie_target,
+        meals=meals_per_day,
+        protein_grams=f"{protein_grams:.0f}",
+        protein_pct=plan.protein_pct,
+        carb_grams=f"{carb_grams:.0f}",
+        carb_pct=plan.carb_pct,
+        fat_grams=f"{fat_grams:.0f}",
+        fat_pct=plan.fat_pct,
+        protein_sources=plan.protein_src,
+        carb_sources=plan.carb_src,
+        fat_sources=plan.fat_src,
+    )
+
+
 @tool
 def create_meal_plan(
     dietary_goal: str,
@@ -242,87 +657,59 @@ def create_meal_plan(
     calorie_target: int = 2000
 ) -> str:
     """Create a personalized meal plan based on dietary goals and restrictions.
-    
+
     Args:
         dietary_goal: Primary goal (weight_loss, muscle_gain, maintenance, performance)
         dietary_restrictions: Any restrictions (vegetarian, vegan, gluten_free, dairy_free, none)
         meals_per_day: Number of meals per day (3-6)
         calorie_target: Target daily calories
     """
-    print(f"🥗 Nutritionist: Creating {dietary_goal} meal plan with {dietary_restrictions} restrictions")
-    
-    # Macronutrient ratios based on goals
-    macro_ratios = {
-        "weight_loss": {"protein": 30, "carbs": 35, "fat": 35},
-        "muscle_gain": {"protein": 25, "carbs": 45, "fat": 30},
-        "maintenance": {"protein": 20, "carbs": 50, "fat": 30},
-        "performance": {"protein": 20, "carbs": 55, "fat": 25}
-    }
-    
-    ratios = macro_ratios.get(dietary_goal, macro_ratios["maintenance"])
-    
-    # Calculate macros in grams
-    protein_cals = calorie_target * (ratios["protein"] / 100)
-    carb_cals = calorie_target * (ratios["carbs"] / 100)
-    fat_cals = calorie_target * (ratios["fat"] / 100)
-    
-    protein_grams = protein_cals / 4
-    carb_grams = carb_cals / 4
-    fat_grams = fat_cals / 9
-    
-    # Sample meal suggestions based on restrictions
-    meal_suggestions = {
-        "none": {
-            "protein": "Chicken, fish, eggs, Greek yogurt, lean beef",
-            "carbs": "Rice, oats, sweet potato, quinoa, fruits",
-            "fats": "Avocado, nuts, olive oil, salmon"
-        },
-        "vegetarian": {
-            "protein": "Eggs, Greek yogurt, legumes, tofu, cheese",
-            "carbs": "Rice, oats, sweet potato, quinoa, fruits",
-            "fats": "Avocado, nuts, olive oil, seeds"
-        },
-        "vegan": {
-            "protein": "Legumes, tofu, tempeh, seitan, protein powder",
-            "carbs": "Rice, oats, sweet potato, quinoa, fruits",
-            "fats": "Avocado, nuts, olive oil, seeds, tahini"
-        },
-        "gluten_free": {
-            "protein": "Chicken, fish, eggs, Greek yogurt, legumes",
-            "carbs": "Rice, quinoa, sweet potato, fruits, GF oats",
-            "fats": "Avocado, nuts, olive oil, salmon"
-        }
-    }
-    
-    suggestions = meal_suggestions.get(dietary_restrictions, meal_suggestions["none"])
-    
-    return f"""
-🍽️ PERSONALIZED MEAL PLAN:
+    logger.debug("🥗 Nutritionist: Creating %s meal plan with %s restrictions", dietary_goal, dietary_restrictions)
+    return _create_meal_plan_cached(
+        dietary_goal, dietary_restrictions, meals_per_day, calorie_target
+    )
 
-Goal: {dietary_goal.replace('_', ' ').title()}
-Restrictions: {dietary_restrictions.replace('_', ' ').title()}
-Daily Calories: {calorie_target}
-Meals per Day: {meals_per_day}
 
-MACRONUTRIENT BREAKDOWN:
-- Protein: {protein_grams:.0f}g ({ratios['protein']}% of calories)
-- Carbohydrates: {carb_grams:.0f}g ({ratios['carbs']}% of calories)
-- Fats: {fat_grams:.0f}g ({ratios['fat']}% of calories)
+@lru_cache(maxsize=512)
+def _calculate_nutrition_needs_cached(
+    weight: float,
+    height_cm: float,
+    age: int,
+    gender: str,
+    activity_level: str,
+    goal: str
+) -> str:
+    """Build the nutrition-needs text; memoized since it is pure in its args."""
+    # Calculate BMR using Mifflin-St Jeor equation
+    bmr = 10 * weight + 6.25 * height_cm - 5 * age + _GENDER_OFFSET.get(gender.casefold(), -161)
 
-FOOD RECOMMENDATIONS:
-Protein Sources: {suggestions['protein']}
-Carbohydrate Sources: {suggestions['carbs']}
-Healthy Fats: {suggestions['fats']}
+    tdee = bmr * _ACTIVITY_MULTIPLIERS.get(activity_level, 1.55)
 
-MEAL TIMING TIPS:
-- Eat protein with every meal
-- Have carbs around workouts
-- Include vegetables with most meals
-- Stay hydrated (8-10 glasses water/day)
-- Plan and prep meals in advance
+    # Adjust calories based on goal
+    target_calories = tdee + _GOAL_ADJUSTMENTS.get(goal, 0)
 
-Duration: Follow for 2-4 weeks, then reassess and adjust
-"""
+    # Calculate protein needs (higher for muscle gain/weight loss)
+    protein_grams = weight * (2.2 if goal in _HIGH_PROTEIN_GOALS else 1.6)
+
+    # Calculate hydration needs (35ml per kg plus exercise allowance)
+    exercise_water = 500 if activity_level in _HIGH_ACTIVITY else 250
+    total_water = weight * 35 + exercise_water
+    
+    return _NUTRITION_NEEDS_TEMPLATE.substitute(
+        gender=_display(gender),
+        age=age,
+        weight=weight,
+        height=height_cm,
+        activity=_display(activity_level),
+        bmr=f"{bmr:.0f}",
+        tdee=f"{tdee:.0f}",
+        goal=_display(goal),
+        target_calories=f"{target_calories:.0f}",
+        protein_grams=f"{protein_grams:.0f}",
+        protein_per_meal=f"{protein_grams/3:.0f}",
+        total_water=f"{total_water:.0f}",
+        glasses=f"{total_water/250:.1f}",
+    )
 
 
 @tool
@@ -335,7 +722,7 @@ def calculate_nutrition_needs(
     goal: str
 ) -> str:
     """Calculate detailed nutritional needs including calories, macros, and hydration.
-    
+
     Args:
         weight: Weight in kg
         height_cm: Height in centimeters
@@ -344,77 +731,12 @@ def calculate_nutrition_needs(
         activity_level: Activity level (sedentary, light, moderate, active, very_active)
         goal: Nutrition goal (weight_loss, muscle_gain, maintenance)
     """
-    print(f"🥗 Nutritionist: Calculating nutrition needs for {gender}, {age} years old")
-    
-    # Calculate BMR using Mifflin-St Jeor equation
-    if gender.lower() == "male":
-        bmr = 10 * weight + 6.25 * height_cm - 5 * age + 5
-    else:
-        bmr = 10 * weight + 6.25 * height_cm - 5 * age - 161
-    
-    # Activity multipliers
-    activity_multipliers = {
-        "sedentary": 1.2,
-        "light": 1.375,
-        "moderate": 1.55,
-        "active": 1.725,
-        "very_active": 1.9
-    }
-    
-    tdee = bmr * activity_multipliers.get(activity_level, 1.55)
-    
-    # Adjust calories based on goal
-    goal_adjustments = {
-        "weight_loss": -500,  # 1 lb per week loss
-        "muscle_gain": +300,  # Lean bulk
-        "maintenance": 0
-    }
-    
-    target_calories = tdee + goal_adjustments.get(goal, 0)
-    
-    # Calculate protein needs (higher for muscle gain/weight loss)
-    if goal in ["muscle_gain", "weight_loss"]:
-        protein_per_kg = 2.2  # Higher protein
-    else:
-        protein_per_kg = 1.6  # Moderate protein
-    
-    protein_grams = weight * protein_per_kg
-    
-    # Calculate hydration needs
-    base_water = weight * 35  # 35ml per kg
-    exercise_water = 500 if activity_level in ["active", "very_active"] else 250
-    total_water = base_water + exercise_water
-    
-    return f"""
-🧮 NUTRITIONAL NEEDS CALCULATED:
-
-Personal Info:
-- Gender: {gender.title()}
-- Age: {age} years
-- Weight: {weight} kg
-- Height: {height_cm} cm
-- Activity: {activity_level.replace('_', ' ').title()}
-
-Caloric Needs:
-- BMR (Base Metabolic Rate): {bmr:.0f} calories/day
-- TDEE (Total Daily Energy): {tdee:.0f} calories/day
-- Target Calories for {goal.replace('_', ' ').title()}: {target_calories:.0f} calories/day
-
-Protein Requirements:
-- Recommended Protein: {protein_grams:.0f}g per day
-- Protein per meal: {protein_grams/3:.0f}g (if 3 meals/day)
-
-Hydration Needs:
-- Daily Water Target: {total_water:.0f}ml ({total_water/250:.1f} glasses)
-- Pre-workout: 250ml (1 hour before)
-- During workout: 150-250ml every 15-20 minutes
-- Post-workout: 150% of fluid lost through sweat
-
-Micronutrient Focus:
-- Vitamin D, B12, Iron (especially for active individuals)
-- Omega-3 fatty acids for recovery
-- Antioxidants from colorful fruits and vegetables
-"""
+    logger.debug("🥗 Nutritionist: Calculating nutrition needs for %s, %s years old", gender, age)
+    # Round the float inputs so trivially-different profiles share a cache
+    # entry.
+    return _calculate_nutrition_needs_cached(
+        round(weight, 1), round(height_cm, 1), age, gender, activity_level, goal
+    )
 
 
 @tool
@@ -432,117 +754,68 @@ def suggest_pre_post_workout_nutrition(
         time_of_day: When working out (morning, afternoon, evening)
         dietary_restrictions: Any dietary restrictions
     """
-    print(f"🥗 Nutritionist: Creating pre/post workout nutrition for {workout_type} training")
-    
-    # Pre-workout recommendations
-    pre_workout = {
-        "strength": {
-            "timing": "30-60 minutes before",
-            "foods": "Banana with almond butter, oatmeal with berries, Greek yogurt with honey"
-        },
-        "cardio": {
-            "timing": "30-45 minutes before", 
-            "foods": "Toast with jam, banana, small smoothie with fruit"
-        },
-        "hiit": {
-            "timing": "30-45 minutes before",
-            "foods": "Apple with small amount of nut butter, dates, small energy bar"
-        },
-        "endurance": {
-            "timing": "1-2 hours before",
-            "foods": "Oatmeal with banana, whole grain toast with honey, energy bar"
-        }
-    }
-    
-    # Post-workout recommendations
-    post_workout = {
-        "strength": {
-            "timing": "Within 30-60 minutes",
-            "foods": "Protein shake with banana, chicken with rice, Greek yogurt with granola"
-        },
-        "cardio": {
-            "timing": "Within 30-45 minutes",
-            "foods": "Chocolate milk, smoothie with protein, turkey sandwich"
-        },
-        "hiit": {
-            "timing": "Within 30 minutes",
-            "foods": "Protein shake, eggs with toast, recovery smoothie"
-        },
-        "endurance": {
-            "timing": "Within 30 minutes",
-            "foods": "Recovery drink, pasta with protein, quinoa bowl with vegetables"
-        }
-    }
-    
-    pre_rec = pre_workout.get(workout_type, pre_workout["strength"])
-    post_rec = post_workout.get(workout_type, post_workout["strength"])
+    logger.debug("🥗 Nutritionist: Creating pre/post workout nutrition for %s training", workout_type)
     
+    pre_rec = _PRE_WORKOUT.get(workout_type, _PRE_WORKOUT["strength"])
+    post_rec = _POST_WORKOUT.get(workout_type, _POST_WORKOUT["strength"])
+
     # Adjust for time of day
-    time_adjustments = {
-        "morning": "Consider lighter pre-workout options, focus on easily digestible carbs",
-        "afternoon": "Normal pre/post workout nutrition timing applies",
-        "evening": "Lighter post-workout meals, avoid heavy foods close to bedtime"
-    }
-    
-    time_note = time_adjustments.get(time_of_day, time_adjustments["afternoon"])
-    
+    time_note = _TIME_ADJUSTMENTS.get(time_of_day, _TIME_ADJUSTMENTS["afternoon"])
+
     # Dietary restriction modifications
-    restriction_mods = {
-        "vegan": "Replace dairy with plant-based alternatives, use plant proteins",
-        "vegetarian": "Include eggs and dairy, focus on complete proteins",
-        "gluten_free": "Use gluten-free grains and certified products",
-        "dairy_free": "Use non-dairy milk alternatives and dairy-free proteins"
-    }
-    
-    restriction_note = restriction_mods.get(dietary_restrictions, "No special modifications needed")
+    restriction_note = _RESTRICTION_MODS.get(dietary_restrictions, "No special modifications needed")
     
-    return f"""
-🏃‍♂️ PRE & POST WORKOUT NUTRITION:
-
-Workout Details:
-- Type: {workout_type.title()}
-- Duration: {workout_duration} minutes
-- Time: {time_of_day.title()}
-- Restrictions: {dietary_restrictions.replace('_', ' ').title()}
-
-PRE-WORKOUT NUTRITION:
-Timing: {pre_rec['timing']}
-Recommended Foods: {pre_rec['foods']}
-Goal: Provide energy, prevent hunger, optimize performance
+    return _PRE_POST_WORKOUT_TEMPLATE.substitute(
+        workout_type=_display(workout_type),
+        duration=workout_duration,
+        time_of_day=_display(time_of_day),
+        restrictions=_display(dietary_restrictions),
+        pre_timing=pre_rec['timing'],
+        pre_foods=pre_rec['foods'],
+        post_timing=post_rec['timing'],
+        post_foods=post_rec['foods'],
+        time_note=time_note,
+        restriction_note=restriction_note,
+    )
 
-POST-WORKOUT NUTRITION:
-Timing: {post_rec['timing']}
-Recommended Foods: {post_rec['foods']}
-Goal: Muscle recovery, glycogen replenishment, adaptation
 
-TIME-SPECIFIC CONSIDERATIONS:
-{time_note}
+# =============================================================================
+# FITNESS AI ORCHESTRATION SYSTEM
+# =============================================================================
 
-DIETARY MODIFICATIONS:
-{restriction_note}
+# Agent names used for specialist attribution in the demo output.
+_SPECIALIST_NAMES = frozenset({"workout_specialist", "nutritionist"})
 
-HYDRATION REMINDERS:
-- Pre-workout: 250ml water 1 hour before
-- During: 150-250ml every 15-20 minutes
-- Post: 150% of fluid lost through sweat
+# Predefined demo responses for the mock-model path, built once at import so
+# create_fitness_ai_system doesn't reallocate them per call.
+_MOCK_RESPONSES = (
+    AIMessage(content="I'll coordinate your fitness consultation with our specialists."),
+    AIMessage(content="I'll create a personalized workout plan for you."),
+    AIMessage(content="I'll design a nutrition plan tailored to your goals."),
+    AIMessage(content="Let me analyze your fitness metrics and suggest modifications."),
+    AIMessage(content="Let me calculate your specific nutritional needs."),
+    AIMessage(content="Here's your customized exercise program."),
+    AIMessage(content="Here are my pre and post-workout nutrition recommendations."),
+    AIMessage(content="Let me connect you with the right expert for your needs."),
+    AIMessage(content="Your comprehensive fitness plan is ready.")
+)
 
-GENERAL TIPS:
-- Avoid high fiber/fat foods immediately pre-workout
-- Include both carbs and protein post-workout
-- Listen to your body and adjust portions as needed
-"""
 
+@lru_cache(maxsize=1)
+def create_fitness_ai_system():
+    """Create the complete fitness AI orchestration system.
 
-# =============================================================================
-# FITNESS AI ORCHESTRATION SYSTEM
-# =============================================================================
+    Memoized: agent construction and workflow.compile() run once per
+    process; repeated demo runs (REPL, tests) reuse the compiled app. Call
+    create_fitness_ai_system.cache_clear() to force a rebuild.
+    """
 
-def create_fitness_ai_system():
-    """Create the complete fitness AI orchestration system."""
-    
     # Check if OpenAI API key is available
     api_key = os.getenv("OPENAI_API_KEY")
-    
+
+    # Single model construction branch: build exactly one model (real or
+    # mock) and alias it for all three agents, so the ChatOpenAI client and
+    # its httpx session pool are only constructed once per system build.
     if api_key:
         print("🔑 OpenAI API key found - using real OpenAI models")
         from langchain_openai import ChatOpenAI
@@ -550,37 +823,13 @@ def create_fitness_ai_system():
     else:
         print("⚠️  No OpenAI API key found - using mock model for demo")
         print("   Set OPENAI_API_KEY environment variable to use real OpenAI")
-        
+
         # Use mock model for demo
         from simple_demo import FakeChatModel
-        
-        # Predefined responses for demo
-        workout_responses = [
-            AIMessage(content="I'll create a personalized workout plan for you."),
-            AIMessage(content="Let me analyze your fitness metrics and suggest modifications."),
-            AIMessage(content="Here's your customized exercise program.")
-        ]
-        
-        nutrition_responses = [
-            AIMessage(content="I'll design a nutrition plan tailored to your goals."),
-            AIMessage(content="Let me calculate your specific nutritional needs."),
-            AIMessage(content="Here are my pre and post-workout nutrition recommendations.")
-        ]
-        
-        supervisor_responses = [
-            AIMessage(content="I'll coordinate your fitness consultation with our specialists."),
-            AIMessage(content="Let me connect you with the right expert for your needs."),
-            AIMessage(content="Your comprehensive fitness plan is ready.")
-        ]
-        
-        workout_model = FakeChatModel(responses=workout_responses)
-        nutrition_model = FakeChatModel(responses=nutrition_responses)
-        supervisor_model = FakeChatModel(responses=supervisor_responses)
-    
-    if api_key:
-        # Use same model for all agents when using real OpenAI
-        workout_model = nutrition_model = supervisor_model = model
-    
+        model = FakeChatModel(responses=_MOCK_RESPONSES)
+
+    workout_model = nutrition_model = supervisor_model = model
+
     print("\n📋 Creating specialized fitness agents...")
     
     # Create Workout Specialist Agent
@@ -656,8 +905,51 @@ def create_fitness_ai_system():
     return app
 
 
-def run_fitness_ai_demo():
-    """Run comprehensive fitness AI orchestration demo."""
+@contextmanager
+def _scenario_guard(i: int):
+    """Shared per-scenario exception handler for the demo loop.
+
+    logger.exception formats the traceback once from the live exception
+    instead of re-importing traceback inside each handler.
+    """
+    try:
+        yield
+    except Exception:
+        logger.exception("❌ Error in scenario %d", i)
+
+
+async def _stream_scenario(fitness_ai, query: str) -> set:
+    """Stream one scenario's model output token-by-token.
+
+    Consumes astream_events instead of materializing the full message list:
+    tokens are written to stdout as they arrive (first-token latency instead
+    of full-graph latency on the OpenAI path) and specialist attribution is
+    tracked from on_chain_start events rather than a post-hoc message scan.
+    Returns the set of specialists that ran.
+    """
+    specialists = set()
+    async for event in fitness_ai.astream_events(
+        {"messages": [HumanMessage(content=query)]}, version="v2"
+    ):
+        kind = event["event"]
+        if kind == "on_chat_model_stream":
+            chunk = event["data"]["chunk"]
+            if isinstance(chunk.content, str) and chunk.content:
+                sys.stdout.write(chunk.content)
+                sys.stdout.flush()
+        elif kind == "on_chain_start" and event.get("name") in _SPECIALIST_NAMES:
+            specialists.add(event["name"])
+    sys.stdout.write("\n")
+    return specialists
+
+
+async def run_fitness_ai_demo():
+    """Run comprehensive fitness AI orchestration demo.
+
+    Scenarios stream token-by-token (see _stream_scenario), so they run
+    sequentially to keep the incremental output readable; perceived latency
+    drops to time-to-first-token rather than full-graph completion.
+    """
     print("🤖 FITNESS AI ORCHESTRATION SYSTEM")
     print("=" * 60)
     print("🏋️ Workout Specialist + 🥗 Nutritionist + 🎯 AI Supervisor")
@@ -666,6 +958,11 @@ def run_fitness_ai_demo():
     try:
         # Create the fitness AI system
         fitness_ai = create_fitness_ai_system()
+        # On the mock-model path the memoized system keeps its response
+        # cursor between runs; rewind any live fakes so repeat runs replay
+        # the scripted responses instead of draining the pool.
+        from simple_demo import FakeChatModel
+        FakeChatModel.reset_all()
         
         # Demo scenarios
         scenarios = [
@@ -701,33 +998,15 @@ def run_fitness_ai_demo():
             print(f"📝 Description: {scenario['description']}")
             print(f"💬 User Query: {scenario['query']}")
             print("-" * 60)
-            
-            try:
-                result = fitness_ai.invoke({
-                    "messages": [HumanMessage(content=scenario["query"])]
-                })
-                
+
+            with _scenario_guard(i):
+                print("\n🎯 AI Coordinator Response:")
+                specialists = await _stream_scenario(fitness_ai, scenario["query"])
+
                 print(f"✅ Scenario {i} completed successfully!")
-                print(f"📊 Messages in conversation: {len(result['messages'])}")
-                
-                # Show the final comprehensive response
-                final_response = result["messages"][-1]
-                print(f"\n🎯 AI Coordinator Response:")
-                print(f"{final_response.content}")
-                
-                # Show which specialists were involved
-                specialist_calls = []
-                for msg in result["messages"]:
-                    if hasattr(msg, 'name') and msg.name in ['workout_specialist', 'nutritionist']:
-                        specialist_calls.append(msg.name)
-                
-                if specialist_calls:
-                    unique_specialists = list(set(specialist_calls))
-                    print(f"\n👥 Specialists Involved: {', '.join(unique_specialists)}")
-                
-            except Exception as e:
-                print(f"❌ Error in scenario {i}: {e}")
-            
+                if specialists:
+                    print(f"\n👥 Specialists Involved: {', '.join(sorted(specialists))}")
+
             print("\n" + "=" * 60)
         
         print("\n🎉 FITNESS AI ORCHESTRATION DEMO COMPLETED!")
@@ -745,11 +1024,10 @@ def run_fitness_ai_demo():
             print("   export OPENAI_API_KEY=your_api_key_here")
             print("   python fitness_ai_orchestration.py")
             
-    except Exception as e:
-        print(f"❌ Error running fitness AI demo: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ Error running fitness AI demo")
 
 
 if __name__ == "__main__":
-    run_fitness_ai_demo() 
\ No newline at end of file
+    logger.setLevel(logging.DEBUG)
+    asyncio.run(run_fitness_ai_demo())
\ No newline at end of file
@@ -5,13 +5,23 @@ This example can work with actual OpenAI API when OPENAI_API_KEY is set.
 """
 
 import os
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.tools import tool
 from langgraph.prebuilt import create_react_agent
 
 from langgraph_supervisor import create_supervisor
 
 
+# Mock responses for the no-API-key path, built once at import so repeated
+# demo/test runs share the same AIMessage objects instead of reallocating
+# them per call.
+_MOCK_RESPONSES = (
+    AIMessage(content="I'll help you with that task."),
+    AIMessage(content="Let me delegate this to the appropriate expert."),
+    AIMessage(content="Task completed successfully.")
+)
+
+
 def create_real_world_demo():
     """Create a real-world demo with actual or mock OpenAI."""
     
@@ -26,16 +36,11 @@ def create_real_world_demo():
         print("⚠️  No OpenAI API key found - using mock model for demo")
         print("   Set OPENAI_API_KEY environment variable to use real OpenAI")
         
-        # Use our mock model from the simple demo
+        # Use our mock model from the simple demo; the shared module-level
+        # response tuple keeps each instance to a cursor over the same pool.
         from simple_demo import FakeChatModel
-        from langchain_core.messages import AIMessage
-        
-        # Simple responses for demo
-        model = FakeChatModel(responses=[
-            AIMessage(content="I'll help you with that task."),
-            AIMessage(content="Let me delegate this to the appropriate expert."),
-            AIMessage(content="Task completed successfully.")
-        ])
+
+        model = FakeChatModel(responses=_MOCK_RESPONSES)
     
     # Define tools for different agents
     @tool
@@ -4,7 +4,8 @@ Simple Demo for LangGraph Multi-Agent Supervisor
 Based on the working test patterns from the project.
 """
 
-from typing import Any, Optional, Sequence, Callable
+import threading
+from typing import Any, ClassVar, Optional, Sequence, Callable
 from langchain_core.callbacks.manager import CallbackManagerForLLMRun
 from langchain_core.language_models.chat_models import BaseChatModel, LanguageModelInput
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
@@ -21,10 +22,37 @@ class FakeChatModel(BaseChatModel):
     idx: int = 0
     responses: Sequence[BaseMessage]
 
+    _INSTANCES: ClassVar[list["FakeChatModel"]] = []
+
+    def model_post_init(self, __context: Any) -> None:
+        # Snapshot the response messages as a plain list for cursor indexing;
+        # _generate hands out copies, never these shared instances.
+        object.__setattr__(self, "_results", list(self.responses))
+        # Guard the response cursor so the model can be shared across the
+        # threads that app.batch / ThreadPoolExecutor runs scenarios on.
+        object.__setattr__(self, "_lock", threading.Lock())
+        FakeChatModel._INSTANCES.append(self)
+
     @property
     def _llm_type(self) -> str:
         return "fake-tool-call-model"
 
+    def reset(self) -> None:
+        """Rewind the response cursor to the start of the pool."""
+        with self._lock:
+            self.idx = 0
+
+    @classmethod
+    def reset_all(cls) -> None:
+        """Rewind every live model's cursor.
+
+        Demos that cache their compiled app keep these models (and their
+        consumed-response position) alive between runs; calling this at the
+        start of a run replays the scripted responses from the top.
+        """
+        for model in cls._INSTANCES:
+            model.reset()
+
     def _generate(
         self,
         messages: list[BaseMessage],
@@ -32,9 +60,15 @@ class FakeChatModel(BaseChatModel):
         run_manager: Optional[CallbackManagerForLLMRun] = None,
         **kwargs: dict[str, Any],
     ) -> ChatResult:
-        generation = ChatGeneration(message=self.responses[self.idx])
-        self.idx += 1
-        return ChatResult(generations=[generation])
+        with self._lock:
+            message = self._results[self.idx]
+            self.idx += 1
+        # langgraph's add_messages assigns ids to id-less messages in place
+        # and replaces same-id repeats, and agents stamp their name onto the
+        # returned message — so hand out a fresh copy rather than the shared
+        # pooled instance (several demos share these module-level tuples
+        # across lru-cached compiled apps).
+        return ChatResult(generations=[ChatGeneration(message=message.model_copy())])
 
     def bind_tools(
         self, tools: Sequence[dict[str, Any] | type | Callable | BaseTool], **kwargs: Any
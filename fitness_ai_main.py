@@ -5,6 +5,8 @@ Fitness AI Main Entry Point
 Production-ready entry point for the Fitness AI Orchestration System.
 """
 
+import functools
+import logging
 import sys
 from pathlib import Path
 
@@ -17,14 +19,35 @@ from fitness_ai.core import (
     get_system_info,
     create_fitness_ai_system
 )
+from fitness_ai.config import get_config
 
-# Export graph for LangGraph Studio
-graph = create_fitness_ai_system()
+# Export graph for LangGraph Studio, built lazily on first access (PEP 562)
+# so importing this module — or running the info/demo paths — doesn't pay for
+# model, agent, and workflow construction up front.
+@functools.cache
+def _get_graph():
+    return create_fitness_ai_system()
+
+
+def __getattr__(name):
+    if name == "graph":
+        return _get_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main():
     """Main entry point with command-line argument parsing."""
     
+    # Initialization and tool progress go through module loggers; without a
+    # handler none of it reaches the terminal. Level follows the config,
+    # falling back to INFO when the config itself can't load so its error
+    # message still shows.
+    try:
+        level = get_config().log_level
+    except Exception:
+        level = logging.INFO
+    logging.basicConfig(level=level, format="%(message)s")
+    
     print("🤖 FITNESS AI ORCHESTRATION SYSTEM")
     print("=" * 50)
     
@@ -5,44 +5,24 @@ Specialized agents for the fitness AI orchestration system.
 Each agent has specific expertise and tools for their domain.
 """
 
-from typing import List, Optional
+from typing import Final, List
 from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import create_react_agent
 from langgraph_supervisor import create_supervisor
 
 from .tools import workout_tools, nutrition_tools
-from .config import config
 
 
-class WorkoutSpecialist:
-    """
-    Workout Specialist Agent
-    
-    Specializes in:
-    - Creating personalized workout plans
-    - Calculating fitness metrics (BMI, BMR, heart rate zones)
-    - Exercise form and technique guidance
-    - Training progression recommendations
-    """
-    
-    def __init__(self, model: Optional[ChatOpenAI] = None):
-        """Initialize the Workout Specialist agent."""
-        self.model = model or ChatOpenAI(
-            model=config.openai_model,
-            temperature=config.openai_temperature,
-            api_key=config.openai_api_key
-        )
-        
-        self.agent = create_react_agent(
-            model=self.model,
-            tools=workout_tools,
-            name="workout_specialist",
-            prompt=self._get_prompt()
-        )
-    
-    def _get_prompt(self) -> str:
-        """Get the specialized prompt for the workout specialist."""
-        return """You are a certified personal trainer and workout specialist with expertise in:
+# The supervisor only emits short routing/merge turns, so its output is
+# capped well below the specialists' config.openai_max_tokens budget —
+# every token saved is one fewer decode step on the critical path.
+_SUPERVISOR_MAX_TOKENS: Final[int] = 256
+
+# Agent prompts, built once at module load. _get_prompt returns these by
+# reference, so every instance hands LangChain the identical string object —
+# no per-call allocation, and stable bytes for both the LLM cache key hash
+# and OpenAI's server-side prompt-prefix cache.
+_WORKOUT_PROMPT: Final[str] = """You are a certified personal trainer and workout specialist with expertise in:
 
 CORE COMPETENCIES:
 - Exercise physiology and biomechanics
@@ -72,36 +52,7 @@ TOOLS AVAILABLE:
 Remember to be encouraging, professional, and focus on sustainable fitness practices.
 Use the tools when appropriate to provide detailed, actionable workout recommendations."""
 
-
-class Nutritionist:
-    """
-    Nutritionist Agent
-    
-    Specializes in:
-    - Creating personalized meal plans
-    - Calculating nutritional needs and macros
-    - Accommodating dietary restrictions
-    - Sports nutrition and timing
-    """
-    
-    def __init__(self, model: Optional[ChatOpenAI] = None):
-        """Initialize the Nutritionist agent."""
-        self.model = model or ChatOpenAI(
-            model=config.openai_model,
-            temperature=config.openai_temperature,
-            api_key=config.openai_api_key
-        )
-        
-        self.agent = create_react_agent(
-            model=self.model,
-            tools=nutrition_tools,
-            name="nutritionist",
-            prompt=self._get_prompt()
-        )
-    
-    def _get_prompt(self) -> str:
-        """Get the specialized prompt for the nutritionist."""
-        return """You are a registered dietitian and sports nutritionist with expertise in:
+_NUTRITION_PROMPT: Final[str] = """You are a registered dietitian and sports nutritionist with expertise in:
 
 CORE COMPETENCIES:
 - Clinical nutrition and metabolism
@@ -131,38 +82,7 @@ TOOLS AVAILABLE:
 Remember to be supportive, non-judgmental, and focus on long-term health outcomes.
 Use the tools when appropriate to create detailed, personalized nutrition recommendations."""
 
-
-class FitnessSupervisor:
-    """
-    Fitness Supervisor Agent
-    
-    Coordinates between workout and nutrition specialists to provide
-    comprehensive fitness consultations and integrated recommendations.
-    """
-    
-    def __init__(self, 
-                 workout_specialist: WorkoutSpecialist,
-                 nutritionist: Nutritionist,
-                 model: Optional[ChatOpenAI] = None):
-        """Initialize the Fitness Supervisor agent."""
-        self.model = model or ChatOpenAI(
-            model=config.openai_model,
-            temperature=config.openai_temperature,
-            api_key=config.openai_api_key
-        )
-        
-        self.workout_specialist = workout_specialist
-        self.nutritionist = nutritionist
-        
-        self.supervisor = create_supervisor(
-            agents=[workout_specialist.agent, nutritionist.agent],
-            model=self.model,
-            prompt=self._get_prompt()
-        )
-    
-    def _get_prompt(self) -> str:
-        """Get the specialized prompt for the fitness supervisor."""
-        return """You are a fitness AI coordinator managing a team of specialized experts:
+_SUPERVISOR_PROMPT: Final[str] = """You are a fitness AI coordinator managing a team of specialized experts:
 
 TEAM MEMBERS:
 🏋️ WORKOUT SPECIALIST: Handles exercise plans, training metrics, and workout guidance
@@ -178,7 +98,8 @@ YOUR ROLE:
 DELEGATION STRATEGY:
 - Workout-related questions → delegate to workout_specialist
 - Nutrition-related questions → delegate to nutritionist
-- Comprehensive fitness plans → coordinate both specialists
+- Comprehensive fitness plans → emit BOTH transfer tool calls in a single
+  response so the specialists work in parallel, then merge their results
 - General fitness advice → use your expertise to guide appropriately
 
 COMMUNICATION STYLE:
@@ -196,18 +117,113 @@ INTEGRATION FOCUS:
 
 Remember: You're not just delegating tasks, you're orchestrating a comprehensive
 fitness consultation that addresses the user's complete health and wellness needs."""
+
+
+class WorkoutSpecialist:
+    """
+    Workout Specialist Agent
+    
+    Specializes in:
+    - Creating personalized workout plans
+    - Calculating fitness metrics (BMI, BMR, heart rate zones)
+    - Exercise form and technique guidance
+    - Training progression recommendations
+    """
+    
+    def __init__(self, model: ChatOpenAI):
+        """Initialize the Workout Specialist agent with the shared model."""
+        self.model = model
+        
+        self.agent = create_react_agent(
+            model=self.model,
+            tools=workout_tools,
+            name="workout_specialist",
+            prompt=self._get_prompt()
+        )
+    
+    def _get_prompt(self) -> str:
+        """Get the specialized prompt for the workout specialist."""
+        return _WORKOUT_PROMPT
+
+
+class Nutritionist:
+    """
+    Nutritionist Agent
+    
+    Specializes in:
+    - Creating personalized meal plans
+    - Calculating nutritional needs and macros
+    - Accommodating dietary restrictions
+    - Sports nutrition and timing
+    """
+    
+    def __init__(self, model: ChatOpenAI):
+        """Initialize the Nutritionist agent with the shared model."""
+        self.model = model
+        
+        self.agent = create_react_agent(
+            model=self.model,
+            tools=nutrition_tools,
+            name="nutritionist",
+            prompt=self._get_prompt()
+        )
+    
+    def _get_prompt(self) -> str:
+        """Get the specialized prompt for the nutritionist."""
+        return _NUTRITION_PROMPT
+
+
+class FitnessSupervisor:
+    """
+    Fitness Supervisor Agent
+    
+    Coordinates between workout and nutrition specialists to provide
+    comprehensive fitness consultations and integrated recommendations.
+    """
+    
+    def __init__(self, 
+                 workout_specialist: WorkoutSpecialist,
+                 nutritionist: Nutritionist,
+                 model: ChatOpenAI):
+        """Initialize the Fitness Supervisor agent with the shared model."""
+        # model_copy shares the underlying HTTP client with the specialists'
+        # model, so the tighter token cap doesn't cost a second connection
+        # pool.
+        self.model = model.model_copy(update={"max_tokens": _SUPERVISOR_MAX_TOKENS})
+
+        self.workout_specialist = workout_specialist
+        self.nutritionist = nutritionist
+        
+        self.supervisor = create_supervisor(
+            agents=[workout_specialist.agent, nutritionist.agent],
+            model=self.model,
+            prompt=self._get_prompt(),
+            # Let the supervisor hand off to both specialists in one turn;
+            # the workout and nutrition legs of a comprehensive plan are
+            # independent, so they run concurrently instead of serialized.
+            parallel_tool_calls=True
+        )
+    
+    def _get_prompt(self) -> str:
+        """Get the specialized prompt for the fitness supervisor."""
+        return _SUPERVISOR_PROMPT
     
     def compile(self):
         """Compile the supervisor workflow."""
         return self.supervisor.compile()
 
 
-def create_fitness_agents(model: Optional[ChatOpenAI] = None) -> tuple[WorkoutSpecialist, Nutritionist, FitnessSupervisor]:
+def create_fitness_agents(model: ChatOpenAI) -> tuple[WorkoutSpecialist, Nutritionist, FitnessSupervisor]:
     """
     Create all fitness AI agents.
     
+    All three agents share the one ChatOpenAI client, so they reuse the same
+    httpx connection pool and produce identical llm_string cache keys — which
+    also maximizes OpenAI's server-side prompt-prefix cache hits on the
+    static system prompts.
+    
     Args:
-        model: Optional ChatOpenAI model to use for all agents
+        model: ChatOpenAI model shared by all agents
     
     Returns:
         Tuple of (workout_specialist, nutritionist, supervisor)
